@@ -120,6 +120,22 @@ def get_project_root() -> Path:
     return Path(getattr(sys, "_MEIPASS", Path(__file__).parent.parent)).resolve()
 
 
+def relative_path_or_none(path: Path, root: Path) -> Optional[Path]:
+    """``path``가 ``root`` 하위이면 상대 경로를, 아니면 ``None``을 반환
+
+    ``Path.relative_to``와 달리 예외를 던지지 않고 문자열 접두사로 비교한다.
+    두 경로 모두 이미 ``resolve()``된 상태라고 가정한다.
+    """
+    path_str = os.path.normcase(str(path))
+    root_str = os.path.normcase(str(root))
+    if path_str == root_str:
+        return Path()
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if not path_str.startswith(prefix):
+        return None
+    return Path(str(path)[len(prefix):])
+
+
 def _resolve_db_path(path_value: str, base_dir: Path) -> Optional[Path]:
     """주어진 문자열을 절대 경로로 변환"""
     if not path_value:
@@ -197,11 +213,10 @@ def normalize_db_record_path(path_str: str, base_dir: Optional[Path] = None) ->
     path_obj = Path(path_str)
 
     if path_obj.is_absolute():
-        try:
-            relative = path_obj.resolve().relative_to(db_root)
-            return f"{DB_ALIAS}/{relative.as_posix()}"
-        except ValueError:
+        relative = relative_path_or_none(path_obj.resolve(), db_root)
+        if relative is None:
             return normalized
+        return f"{DB_ALIAS}/{relative.as_posix()}"
 
     return f"{DB_ALIAS}/{normalized}"
 
@@ -223,8 +238,8 @@ def resolve_db_path(path_str: str, base_dir: Optional[Path] = None) -> Path:
 def to_db_record_path(path: Path, base_dir: Optional[Path] = None) -> str:
     """실제 경로를 저장용 DB 경로 문자열로 변환"""
     db_root = get_db_base_path(base_dir)
-    try:
-        relative = path.resolve().relative_to(db_root)
-        return f"{DB_ALIAS}/{relative.as_posix()}"
-    except ValueError:
-        return path.resolve().as_posix()
+    resolved = path.resolve()
+    relative = relative_path_or_none(resolved, db_root)
+    if relative is None:
+        return resolved.as_posix()
+    return f"{DB_ALIAS}/{relative.as_posix()}"
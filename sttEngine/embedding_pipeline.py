@@ -11,16 +11,26 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
+import marshal
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Tuple
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
 import requests
 
+try:
+    from filelock import FileLock
+    FILELOCK_AVAILABLE = True
+except ImportError:
+    FILELOCK_AVAILABLE = False
+
 # 설정 모듈 임포트
 # 패키지 내부 실행 시에는 최상위 디렉토리가 ``sys.path``에 없어
 # ``sttEngine`` 모듈을 찾지 못하는 문제가 있었다.
@@ -31,9 +41,11 @@ from config import (
     get_db_base_path,
     get_default_model,
     get_model_for_task,
+    relative_path_or_none,
     resolve_db_path,
     to_db_record_path,
 )
+import json_store
 from ollama_utils import ensure_ollama_server
 from vocabulary_manager import VocabularyManager
 
@@ -41,6 +53,22 @@ DB_BASE_PATH = get_db_base_path()
 WHISPER_OUTPUT_DIR = DB_BASE_PATH / "whisper_output"
 VECTOR_DIR = DB_BASE_PATH / "vector_store"
 INDEX_FILE = VECTOR_DIR / "index.json"
+# Append-only journal of entries written since the last full ``index.json`` dump.
+INDEX_LOG_FILE = VECTOR_DIR / "index.log"
+# ``marshal`` snapshot of the merged index; see ``load_index``.
+INDEX_SNAPSHOT_FILE = VECTOR_DIR / "index.snap"
+# ``index.json`` files carrying this marker already hold canonical keys.
+INDEX_SCHEMA_VERSION = 2
+# Held by every index writer (journal appends and full saves).
+INDEX_LOCK_FILE = VECTOR_DIR / "index.lock"
+# A journal append folds the journal back into ``index.json`` once it grows
+# past both this size and the size of ``index.json`` itself.
+INDEX_LOG_COMPACT_MIN_BYTES = 256 * 1024
+
+# Prefixes checked for every key during ``load_index``; built once at import.
+_DB_PREFIX = f"{DB_ALIAS}/"
+_WHISPER_PREFIX = "whisper_output/"
+_ABSOLUTE_KEY_RE = re.compile(r"[A-Za-z]:/|//" if os.name == "nt" else r"/")
 
 # Initialize vocabulary manager for STT accuracy improvement
 VOCAB_MANAGER = VocabularyManager(vocab_path=str(DB_BASE_PATH / "vocab.json"))
@@ -54,16 +82,14 @@ def _format_relative_path(relative: Path) -> str:
     return os.sep.join(parts)
 
 
-def _index_key_for_path(path: Path) -> str:
+def index_key_for_path(path: Path) -> str:
     """Generate the canonical index key for a given file path."""
     resolved = path.resolve()
 
     for base in (WHISPER_OUTPUT_DIR, DB_BASE_PATH):
-        try:
-            relative = resolved.relative_to(base)
+        relative = relative_path_or_none(resolved, base)
+        if relative is not None:
             return _format_relative_path(relative)
-        except ValueError:
-            continue
 
     record_path = to_db_record_path(resolved, DB_BASE_PATH)
     if record_path.startswith(f"{DB_ALIAS}/"):
@@ -71,6 +97,14 @@ def _index_key_for_path(path: Path) -> str:
     return record_path.replace("/", os.sep)
 
 
+def _join_key_parts(normalized: str) -> str:
+    """Join a ``/``-separated relative key with ``os.sep`` without building a Path."""
+    parts = [part for part in normalized.split("/") if part and part != "."]
+    if not parts:
+        return Path(normalized).as_posix()
+    return os.sep.join(parts)
+
+
 def _normalize_index_key(key: str) -> str:
     """Normalize stored keys (absolute, DB alias, etc.) to the canonical form."""
     if not key:
@@ -78,25 +112,20 @@ def _normalize_index_key(key: str) -> str:
 
     normalized = key.replace("\\", "/")
 
-    if normalized.startswith(f"{DB_ALIAS}/"):
+    if normalized.startswith(_DB_PREFIX):
         try:
             resolved = resolve_db_path(normalized, DB_BASE_PATH)
-            return _index_key_for_path(resolved)
+            return index_key_for_path(resolved)
         except Exception:
-            normalized = normalized[len(DB_ALIAS) + 1 :]
+            normalized = normalized[len(_DB_PREFIX):]
 
-    path_obj = Path(normalized)
-    if path_obj.is_absolute():
-        return _index_key_for_path(path_obj)
+    if _ABSOLUTE_KEY_RE.match(normalized):
+        return index_key_for_path(Path(normalized))
 
-    if normalized.startswith("whisper_output/"):
-        try:
-            relative = Path(normalized).relative_to("whisper_output")
-            return _format_relative_path(relative)
-        except ValueError:
-            pass
+    if normalized.startswith(_WHISPER_PREFIX):
+        return _join_key_parts(normalized[len(_WHISPER_PREFIX):])
 
-    return _format_relative_path(Path(normalized))
+    return _join_key_parts(normalized)
 
 
 def resolve_index_path(key: str, meta: Dict[str, str] | None = None) -> Path:
@@ -134,87 +163,370 @@ def resolve_index_path(key: str, meta: Dict[str, str] | None = None) -> Path:
     return (WHISPER_OUTPUT_DIR / relative).resolve()
 
 
+def _read_index_log(offset: int = 0) -> tuple[list[tuple[str, Dict[str, str] | None]], int]:
+    """Return journaled ``(key, entry)`` records after ``offset`` in write order.
+
+    A ``None`` entry marks a removed key. Also returns the byte offset just
+    past the last complete line, so a torn trailing line left by an
+    interrupted (or still running) append is read again next time.
+    """
+    if not INDEX_LOG_FILE.exists():
+        return [], 0
+
+    records: list[tuple[str, Dict[str, str] | None]] = []
+    with INDEX_LOG_FILE.open("rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            try:
+                record = json_store.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict) or not record.get("key"):
+                continue
+            entry = record.get("entry")
+            records.append((record["key"], entry if isinstance(entry, dict) else None))
+    return records, offset
+
+
+# Threads of this process queue on the RLock; other processes (e.g. the
+# embedding CLI) on ``index.lock`` when ``filelock`` is installed. One
+# ``FileLock`` instance is shared so nested acquisition stays reentrant.
+_index_thread_lock = threading.RLock()
+_index_file_lock = FileLock(str(INDEX_LOCK_FILE)) if FILELOCK_AVAILABLE else None
+
+
+@contextmanager
+def _index_write_lock():
+    """Serialize writers of ``index.json``, ``index.log`` and ``index.snap``."""
+    with _index_thread_lock:
+        if _index_file_lock is None:
+            yield
+            return
+        VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+        with _index_file_lock:
+            yield
+
+
+class IndexView(dict):
+    """Index mapping returned by :func:`load_index`.
+
+    ``source`` is the ``(index.json signature, journal offset)`` the mapping
+    was built from, so :func:`save_index` can pick up journal records other
+    writers appended after the load instead of discarding them.
+    """
+
+    def __init__(self, entries=(), source: tuple | None = None):
+        super().__init__(entries)
+        self.source = source
+
+
+def _apply_index_journal(
+    index: Dict[str, Dict[str, str]],
+    journal: list[tuple[str, Dict[str, str] | None]],
+) -> None:
+    """Replay journal records onto ``index`` in write order."""
+    for key, entry in journal:
+        new_key = _normalize_index_key(key)
+        if entry is None:
+            index.pop(new_key, None)
+            continue
+        if "base" not in entry:
+            _infer_index_base(entry, key, new_key)
+        index[new_key] = entry
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def index_signature() -> tuple:
+    """Return a value that changes whenever the index is written.
+
+    Combines the ``(mtime_ns, size)`` of ``index.json`` and ``index.log``;
+    both full saves and journal appends change it.
+    """
+    return _file_signature(INDEX_FILE), _file_signature(INDEX_LOG_FILE)
+
+
+def _read_index_snapshot(
+    index_signature: tuple[int, int] | None,
+) -> tuple[Dict[str, Dict[str, str]], int] | None:
+    """Return ``(index, log_offset)`` from ``index.snap``.
+
+    The snapshot is only trusted when it was taken from the current
+    ``index.json`` and the journal has not been truncated since.
+    """
+    try:
+        version, signature, log_offset, index = marshal.loads(
+            INDEX_SNAPSHOT_FILE.read_bytes()
+        )
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != INDEX_SCHEMA_VERSION or signature != index_signature:
+        return None
+    log_signature = _file_signature(INDEX_LOG_FILE)
+    log_size = log_signature[1] if log_signature else 0
+    if log_size < log_offset:
+        return None
+    return index, log_offset
+
+
+def _write_index_snapshot(
+    index_signature: tuple[int, int] | None,
+    log_offset: int,
+    index: Dict[str, Dict[str, str]],
+) -> None:
+    """Store the merged index in ``marshal`` form for the next :func:`load_index`."""
+    try:
+        data = marshal.dumps(
+            (INDEX_SCHEMA_VERSION, index_signature, log_offset, index)
+        )
+        json_store.atomic_write_bytes(INDEX_SNAPSHOT_FILE, data)
+    except (OSError, ValueError):
+        INDEX_SNAPSHOT_FILE.unlink(missing_ok=True)
+
+
+def _entry_mtime_ns(meta: Dict[str, str]) -> int | None:
+    """Return the source file mtime of an index entry in nanoseconds.
+
+    Entries written before ``mtime_ns`` was stored only carry an ISO
+    ``timestamp`` string, which is converted on demand.
+    """
+    mtime_ns = meta.get("mtime_ns")
+    if isinstance(mtime_ns, int):
+        return mtime_ns
+    timestamp = meta.get("timestamp")
+    if not timestamp:
+        return None
+    try:
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000_000)
+    except (TypeError, ValueError):
+        return None
+
+
+def entry_datetime(meta: Dict[str, str]) -> datetime | None:
+    """Return the source file modification time of an index entry for display/filtering."""
+    mtime_ns = _entry_mtime_ns(meta)
+    if mtime_ns is None:
+        return None
+    return datetime.fromtimestamp(mtime_ns / 1_000_000_000)
+
+
+def _infer_index_base(meta: Dict[str, str], key: str, new_key: str) -> None:
+    """Fill in ``meta["base"]`` for entries stored without a base hint."""
+    original_path = None
+    try:
+        original_path = Path(key)
+    except Exception:
+        original_path = None
+
+    resolved_path = None
+    if original_path is not None:
+        try:
+            resolved_path = original_path.resolve()
+        except Exception:
+            resolved_path = None
+
+    if resolved_path is not None:
+        for label, base_path in (("whisper_output", WHISPER_OUTPUT_DIR), ("db", DB_BASE_PATH)):
+            if relative_path_or_none(resolved_path, base_path) is not None:
+                meta["base"] = label
+                break
+    else:
+        parts = Path(new_key.replace("\\", "/")).parts
+        if parts:
+            head = parts[0]
+            if head in {"uploads", "vector_store", "deleted", "log", "whisper_output"}:
+                meta["base"] = "db"
+            else:
+                meta["base"] = "whisper_output"
+
+
 def load_index() -> Dict[str, Dict[str, str]]:
-    """Load the JSON index mapping relative file paths to metadata."""
-    if INDEX_FILE.exists():
-        with INDEX_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        normalized_index: Dict[str, Dict[str, str]] = {}
-        changed = False
-        for key, value in data.items():
-            meta: Dict[str, str] = dict(value) if isinstance(value, dict) else {}
-            new_key = _normalize_index_key(key)
-
-            if "base" not in meta:
-                original_path = None
-                try:
-                    original_path = Path(key)
-                except Exception:
-                    original_path = None
-
-                resolved_path = None
-                if original_path is not None:
-                    try:
-                        resolved_path = original_path.resolve()
-                    except Exception:
-                        resolved_path = None
-
-                if resolved_path is not None:
-                    for label, base_path in (("whisper_output", WHISPER_OUTPUT_DIR), ("db", DB_BASE_PATH)):
-                        try:
-                            resolved_path.relative_to(base_path)
-                            meta["base"] = label
-                            break
-                        except ValueError:
-                            continue
-                else:
-                    parts = Path(new_key.replace("\\", "/")).parts
-                    if parts:
-                        head = parts[0]
-                        if head in {"uploads", "vector_store", "deleted", "log", "whisper_output"}:
-                            meta["base"] = "db"
-                        else:
-                            meta["base"] = "whisper_output"
-
-            if new_key in normalized_index and normalized_index[new_key] != meta:
-                existing_ts = normalized_index[new_key].get("timestamp")
-                new_ts = meta.get("timestamp")
-                if existing_ts and new_ts:
-                    if new_ts > existing_ts:
-                        normalized_index[new_key] = meta
-                else:
+    """Load the JSON index mapping relative file paths to metadata.
+
+    Entries appended to ``index.log`` by :func:`save_index_entry` are replayed
+    on top of ``index.json`` (last write wins).
+
+    Files written with the current ``_schema`` marker are trusted as-is; only
+    legacy files go through key normalization.
+
+    When ``index.snap`` matches the current ``index.json`` it is used instead
+    of parsing JSON, and only journal lines appended after it are replayed.
+
+    Loading never writes: the snapshot is refreshed by :func:`save_index`,
+    and the journal is compacted (and a legacy file upgraded) by
+    :func:`save_index_entries` and :func:`compact_index`, all under the index
+    write lock.
+    """
+    index_signature = _file_signature(INDEX_FILE)
+    snapshot = _read_index_snapshot(index_signature)
+    if snapshot is not None:
+        normalized_index, log_offset = snapshot
+    else:
+        data: Dict[str, Dict[str, str]] = {}
+        if index_signature is not None:
+            data = json_store.read_json(INDEX_FILE)
+
+        if data.get("_schema") == INDEX_SCHEMA_VERSION:
+            normalized_index = data.get("entries", {})
+        else:
+            normalized_index = _migrate_legacy_index(data)
+        log_offset = 0
+
+    journal, log_offset = _read_index_log(log_offset)
+    _apply_index_journal(normalized_index, journal)
+    return IndexView(normalized_index, (index_signature, log_offset))
+
+
+def compact_index() -> None:
+    """Fold the journal into ``index.json`` and refresh the snapshot.
+
+    Also rewrites a legacy ``index.json`` with the schema marker. Meant for
+    writer paths such as server startup; readers only call :func:`load_index`.
+    """
+    with _index_write_lock():
+        if _file_signature(INDEX_FILE) is None and _file_signature(INDEX_LOG_FILE) is None:
+            return
+        save_index(load_index())
+
+
+def _migrate_legacy_index(data: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Normalize keys of a pre-schema index, merging duplicates by timestamp."""
+    normalized_index: Dict[str, Dict[str, str]] = {}
+    for key, value in data.items():
+        meta: Dict[str, str] = dict(value) if isinstance(value, dict) else {}
+        new_key = _normalize_index_key(key)
+
+        if "base" not in meta:
+            _infer_index_base(meta, key, new_key)
+
+        if new_key in normalized_index and normalized_index[new_key] != meta:
+            existing_ts = _entry_mtime_ns(normalized_index[new_key])
+            new_ts = _entry_mtime_ns(meta)
+            if existing_ts is not None and new_ts is not None:
+                if new_ts > existing_ts:
                     normalized_index[new_key] = meta
-                changed = True
-                continue
+            else:
+                normalized_index[new_key] = meta
+            continue
 
-            if new_key != key or meta != value:
-                changed = True
-            normalized_index[new_key] = meta
+        normalized_index[new_key] = meta
 
-        if changed:
-            save_index(normalized_index)
-        return normalized_index
-    return {}
+    return normalized_index
 
 
 def save_index(index: Dict[str, Dict[str, str]]) -> None:
-    """Persist the JSON index to disk."""
-    VECTOR_DIR.mkdir(parents=True, exist_ok=True)
-    with INDEX_FILE.open("w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+    """Persist the full JSON index to disk and truncate the journal.
+
+    Runs under the index write lock, so no journal append can land between
+    the rewrite and the truncation. When ``index`` came from
+    :func:`load_index`, records journaled by other writers after that load
+    are replayed onto it first (they are newer than the loaded state).
+    """
+    with _index_write_lock():
+        entries = dict(index)
+        source = getattr(index, "source", None)
+        if source is not None and source[0] == _file_signature(INDEX_FILE):
+            journal, _ = _read_index_log(source[1])
+            _apply_index_journal(entries, journal)
+
+        VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+        payload = {"_schema": INDEX_SCHEMA_VERSION, "entries": entries}
+        json_store.write_json(INDEX_FILE, payload)
+        INDEX_LOG_FILE.unlink(missing_ok=True)
+        _write_index_snapshot(_file_signature(INDEX_FILE), 0, entries)
+
+
+def save_index_entry(key: str, entry: Dict[str, str] | None) -> None:
+    """Append a single index entry to the journal without rewriting the index.
+
+    Pass ``None`` as ``entry`` to record the removal of ``key``.
+    """
+    save_index_entries([(key, entry)])
+
+
+def save_index_entries(items: Iterable[Tuple[str, Dict[str, str] | None]]) -> None:
+    """Append several ``(key, entry)`` records to the journal in one write."""
+    data = b"".join(
+        json_store.dumps({"key": key, "entry": entry}, indent=False) + b"\n"
+        for key, entry in items
+    )
+    if not data:
+        return
+    with _index_write_lock():
+        VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+        with INDEX_LOG_FILE.open("ab") as f:
+            f.write(data)
+            log_size = f.tell()
+        index_size = (_file_signature(INDEX_FILE) or (0, 0))[1]
+        if log_size > max(INDEX_LOG_COMPACT_MIN_BYTES, index_size):
+            save_index(load_index())
+
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_digest(path: Path) -> bytes:
+    """Return the raw 32-byte SHA256 digest of the given file."""
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read loop runs in C with a large buffer
+            return hashlib.file_digest(f, "sha256").digest()
+        h = hashlib.sha256()
+        buffer = bytearray(_HASH_BLOCK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            h.update(view[:size])
+        return h.digest()
 
 
 def file_hash(path: Path) -> str:
     """Return a stable SHA256 checksum for the given file."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return file_digest(path).hex()
+
+
+def entry_matches_stat(meta: Dict[str, str] | None, stat: os.stat_result) -> bool:
+    """Return True if ``meta`` was indexed from a file with this mtime and size.
+
+    Such files are treated as unchanged, so their checksum does not have to
+    be recomputed. Entries without a recorded size never match.
+    """
+    if not meta or not meta.get("sha256"):
+        return False
+    return meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size
+
+
+def file_hashes(paths: list[Path], workers: int = 4) -> Dict[Path, str]:
+    """Hash several files concurrently.
+
+    ``hashlib`` and file reads release the GIL, so a small thread pool
+    overlaps I/O and hashing across files.
+    """
+    if not paths:
+        return {}
+    workers = max(1, min(workers, os.cpu_count() or 1, len(paths)))
+    if workers == 1:
+        return {path: file_hash(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(file_hash, paths)))
 
 
 DEFAULT_MAX_CHARS = int(os.environ.get("EMBEDDING_MAX_PROMPT_CHARS", "7500"))
+# Number of inputs sent per ``/api/embed`` request.
+EMBEDDING_BATCH_SIZE = max(1, int(os.environ.get("EMBEDDING_BATCH_SIZE", "16")))
+# Number of embedding batches run_incremental_embedding keeps in flight.
+EMBEDDING_MAX_WORKERS = max(1, int(os.environ.get("EMBEDDING_MAX_WORKERS", "4")))
 
 
 def _chunk_text(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> list[str]:
@@ -254,12 +566,14 @@ def _chunk_text(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> list[str]:
 
 
 def _request_embedding(model_name: str, prompt: str) -> np.ndarray:
+    payload = {"model": model_name, "prompt": prompt}
+    # Encode the body ourselves so the prompt is serialized straight to UTF-8
+    # bytes instead of an intermediate ASCII-escaped ``str``.
+    body = json_store.dumps(payload, indent=False)
     response = requests.post(
         "http://localhost:11434/api/embeddings",
-        json={
-            "model": model_name,
-            "prompt": prompt
-        },
+        data=body,
+        headers={"Content-Type": "application/json"},
         timeout=30
     )
 
@@ -277,6 +591,72 @@ def _request_embedding(model_name: str, prompt: str) -> np.ndarray:
     return np.array(embedding, dtype=np.float32)
 
 
+def _request_embeddings(model_name: str, inputs: list[str]) -> list[np.ndarray] | None:
+    """Embed several inputs with a single ``/api/embed`` request.
+
+    Returns ``None`` when the server answers 404 (Ollama releases without the
+    batch endpoint) so the caller can fall back to one request per input.
+    """
+    body = json_store.dumps({"model": model_name, "input": inputs}, indent=False)
+    response = requests.post(
+        "http://localhost:11434/api/embed",
+        data=body,
+        headers={"Content-Type": "application/json"},
+        timeout=30 + 10 * len(inputs)
+    )
+    if response.status_code == 404:
+        return None
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        detail = response.text.strip()
+        message = f"Ollama 응답 오류 {response.status_code}: {detail or 'no details'}"
+        raise requests.HTTPError(message) from exc
+
+    embeddings = response.json().get("embeddings") or []
+    if len(embeddings) != len(inputs) or not all(embeddings):
+        raise ValueError("Ollama returned fewer embeddings than inputs")
+    return [np.array(embedding, dtype=np.float32) for embedding in embeddings]
+
+
+def embed_texts_ollama(texts: list[str], model_name: str) -> list[np.ndarray]:
+    """여러 텍스트를 일괄 요청으로 임베딩.
+
+    각 텍스트를 :func:`embed_text_ollama`와 같이 조각으로 나눈 뒤, 모든 조각을
+    ``EMBEDDING_BATCH_SIZE``개씩 묶어 요청하고 텍스트별 조각 임베딩의 평균을 반환한다.
+    """
+    server_ok, server_msg = ensure_ollama_server()
+    if not server_ok:
+        raise Exception(f"Ollama 서버를 사용할 수 없습니다: {server_msg}")
+
+    pieces: list[str] = []
+    owners: list[int] = []
+    for position, text in enumerate(texts):
+        text = text.strip()
+        if not text:
+            raise ValueError("임베딩할 텍스트가 비어 있습니다.")
+        for chunk in _chunk_text(text):
+            pieces.append(chunk)
+            owners.append(position)
+
+    vectors: list[np.ndarray] = []
+    for start in range(0, len(pieces), EMBEDDING_BATCH_SIZE):
+        batch = pieces[start:start + EMBEDDING_BATCH_SIZE]
+        embedded = _request_embeddings(model_name, batch)
+        if embedded is None:
+            embedded = [_request_embedding(model_name, piece) for piece in batch]
+        vectors.extend(embedded)
+
+    grouped: list[list[np.ndarray]] = [[] for _ in texts]
+    for owner, vector in zip(owners, vectors):
+        grouped[owner].append(vector)
+    return [
+        parts[0] if len(parts) == 1 else np.mean(np.vstack(parts), axis=0)
+        for parts in grouped
+    ]
+
+
 def embed_text_ollama(text: str, model_name: str) -> np.ndarray:
     """Ollama API를 사용하여 텍스트를 임베딩.
 
@@ -310,14 +690,18 @@ def embed_text_ollama(text: str, model_name: str) -> np.ndarray:
 
 def process_file(model_name: str, path: Path, index: Dict[str, Dict[str, str]]) -> None:
     """Embed a single file if it is new or has changed since last run."""
-    checksum = file_hash(path)
-    key = _index_key_for_path(path)
+    # Read the file once and derive both the checksum and the text from it.
+    data = path.read_bytes()
+    checksum = hashlib.sha256(data).hexdigest()
+    key = index_key_for_path(path)
 
     # Check if file is already indexed
     already_indexed = index.get(key, {}).get("sha256") == checksum
 
     # Always update vocabulary, even for already-indexed files
-    text = path.read_text(encoding="utf-8")
+    # Same newline translation as ``read_text`` so CRLF files chunk as before.
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    del data
     try:
         VOCAB_MANAGER.update_vocab(text)
     except Exception as e:
@@ -335,18 +719,17 @@ def process_file(model_name: str, path: Path, index: Dict[str, Dict[str, str]])
     entry = {
         "sha256": checksum,
         "vector": out_file.name,
-        "timestamp": datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+        "mtime_ns": path.stat().st_mtime_ns,
     }
 
+    resolved = path.resolve()
     for label, base_path in (("whisper_output", WHISPER_OUTPUT_DIR), ("db", DB_BASE_PATH)):
-        try:
-            path.resolve().relative_to(base_path)
+        if relative_path_or_none(resolved, base_path) is not None:
             entry["base"] = label
             break
-        except ValueError:
-            continue
 
     index[key] = entry
+    save_index_entry(key, entry)
 
 
 def main(src_dir: str) -> None:
@@ -364,7 +747,6 @@ def main(src_dir: str) -> None:
         except Exception as e:
             print(f"파일 {file} 임베딩 실패: {e}")
             continue
-    save_index(index)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""JSON serialization and atomic file writes for the DB stores.
+
+``upload_history.json``, ``file_registry.json`` and the vector index are
+rewritten as a whole on every mutation. ``orjson`` is used when it is
+installed, with the standard ``json`` module as a fallback, and files are
+replaced atomically so readers never observe a half-written store.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, *, indent: bool = True) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (2-space indent by default)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib handle the edge case
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, durable: bool = False) -> None:
+    """Write ``data`` to a temporary sibling file and rename it over ``path``.
+
+    The rename alone keeps readers from seeing partial files; ``durable``
+    additionally fsyncs the data before the rename so it survives a crash.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_json(path: Path) -> Any:
+    """Load a JSON document from ``path``."""
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, obj: Any, *, indent: bool = True, durable: bool = False) -> None:
+    """Atomically replace ``path`` with the JSON encoding of ``obj``."""
+    atomic_write_bytes(path, dumps(obj, indent=indent), durable=durable)
@@ -6,6 +6,8 @@ from pathlib import Path
 
 from workflow.summarize import read_text_with_fallback
 
+_TOKEN_RE = re.compile(r"[\w']+")
+
 
 def keyword_frequency(file_path: Path, top_n: int = 20):
     """Calculate top N keyword frequencies from a text file.
@@ -18,8 +20,7 @@ def keyword_frequency(file_path: Path, top_n: int = 20):
         A list of tuples (keyword, count) sorted by frequency.
     """
     text = read_text_with_fallback(file_path)
-    words = re.findall(r"[\w']+", text.lower())
-    counter = Counter(words)
+    counter = Counter(_TOKEN_RE.findall(text.lower()))
     return counter.most_common(top_n)
 
 
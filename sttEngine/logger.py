@@ -1,4 +1,9 @@
+import atexit
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -11,29 +16,65 @@ except Exception:  # pragma: no cover - during packaging or direct execution
         get_db_base_path = None  # type: ignore
 
 MAX_LOG_SIZE = 1 * 1024 * 1024  # 1MB
+# Encoded bytes the writer thread accumulates before issuing an ``os.write``.
+WRITE_BUFFER_SIZE = 8192
+# Longest time buffered output may wait before it is written out.
+WRITER_FLUSH_INTERVAL = 0.1
+# How long the idle writer thread waits for new messages.
+WRITER_POLL_INTERVAL = 0.1
+
+_STOP = object()
+
 
 class _LogFile:
+    """Rotating log file written from a background thread.
+
+    ``write`` only enqueues the message; a daemon thread encodes queued
+    messages into a buffer and appends it with a single ``os.write`` once
+    ``WRITE_BUFFER_SIZE`` bytes accumulate or ``WRITER_FLUSH_INTERVAL`` passes.
+    ``flush`` waits until everything queued before it has been written.
+    """
+
     def __init__(self, directory: Path, max_bytes: int = MAX_LOG_SIZE) -> None:
         self.directory = directory
         self.max_bytes = max_bytes
         self.directory.mkdir(parents=True, exist_ok=True)
-        self._file = self._open_latest()
+        self._fd, self._size = self._open_latest()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
         self.write(f"--- Log started at {datetime.now().isoformat()} ---\n")
 
-    def _open_latest(self):
-        logs = sorted(self.directory.glob("*.log"))
-        if logs:
-            last = logs[-1]
-            if last.stat().st_size < self.max_bytes:
-                return open(last, "a", encoding="utf-8")
+    def _open_latest(self) -> tuple[int, int]:
+        # Timestamped names sort chronologically, so the newest log is the
+        # lexicographic maximum; only that entry is stat'ed.
+        with os.scandir(self.directory) as entries:
+            last = max(
+                (entry for entry in entries if entry.name.endswith(".log")),
+                key=lambda entry: entry.name,
+                default=None,
+            )
+        if last is not None:
+            size = last.stat().st_size
+            if size < self.max_bytes:
+                return self._open(Path(last.path)), size
         name = self._timestamped_name()
-        return open(self.directory / name, "a", encoding="utf-8")
+        return self._open(self.directory / name), 0
+
+    @staticmethod
+    def _open(path: Path) -> int:
+        return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
     def _rollover(self):
-        if self._file:
-            self._file.close()
         name = self._timestamped_name()
-        self._file = open(self.directory / name, "a", encoding="utf-8")
+        old_fd, self._fd = self._fd, self._open(self.directory / name)
+        self._size = 0
+        try:
+            os.close(old_fd)
+        except OSError:
+            pass
 
     def _timestamped_name(self) -> str:
         """Return a filesystem-safe log file name for the current timestamp."""
@@ -41,16 +82,85 @@ class _LogFile:
         # replacing the separators with ``-``.
         return datetime.now().strftime("%Y-%m-%d_%H-%M-%S.log")
 
+    def _write_bytes(self, data: bytes) -> None:
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rollover()
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        self._size += len(data)
+
+    def _flush_pending(self, pending: bytearray) -> None:
+        if not pending:
+            return
+        try:
+            self._write_bytes(bytes(pending))
+        except OSError:
+            pass
+        pending.clear()
+
+    def _run(self) -> None:
+        pending = bytearray()
+        deadline = None
+        while True:
+            if deadline is None:
+                timeout = WRITER_POLL_INTERVAL
+            else:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush_pending(pending)
+                return
+            if isinstance(item, threading.Event):
+                # flush() barrier: write what is buffered, then release it
+                self._flush_pending(pending)
+                deadline = None
+                item.set()
+                continue
+            if item is not None:
+                if not pending:
+                    deadline = time.monotonic() + WRITER_FLUSH_INTERVAL
+                pending += item.encode("utf-8", "replace")
+                if len(pending) < WRITE_BUFFER_SIZE and time.monotonic() < deadline:
+                    continue
+            elif not pending:
+                continue
+
+            self._flush_pending(pending)
+            deadline = None
+
     def write(self, message: str) -> None:
         if not isinstance(message, str):
             message = str(message)
-        if self._file.tell() + len(message.encode("utf-8")) > self.max_bytes:
-            self._rollover()
-        self._file.write(message)
-        self._file.flush()
+        if self._closed:
+            self._write_bytes(message.encode("utf-8", "replace"))
+            return
+        self._queue.put(message)
 
     def flush(self) -> None:
-        self._file.flush()
+        """Block until every message written so far has reached the file."""
+        if self._closed or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(WRITER_POLL_INTERVAL):
+            if not self._writer.is_alive():
+                return
+
+    def close(self) -> None:
+        """Drain pending messages and stop the writer thread."""
+        if self._closed:
+            return
+        # Later writes go straight to the file so nothing queued after the
+        # stop marker is lost.
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
 
 def _get_log_directory() -> Path:
     """Resolve the log directory respecting the configured DB folder."""
@@ -68,28 +178,42 @@ def _get_log_directory() -> Path:
     return (project_root / "db" / "log").resolve()
 
 
-def setup_logging():
-    """Redirect stdout and stderr to log files while keeping console output."""
-    log_dir = _get_log_directory()
-    logfile = _LogFile(log_dir)
+class Tee:
+    """Duplicate writes to the original console stream and the log file.
+
+    Console output goes through the original text stream, so it stays in
+    order with anything else written to ``sys.__stdout__``/``sys.__stderr__``
+    directly. The stream is only flushed once a line (``\n``) or progress
+    update (``\r``) completes, instead of after every ``write``.
+    """
+
+    def __init__(self, stream, logfile):
+        self.stream = stream
+        self.logfile = logfile
 
-    class Tee:
-        def __init__(self, *streams):
-            self.streams = streams
+    def write(self, data):
+        if not isinstance(data, str):
+            data = str(data)
+        self.logfile.write(data)
+        self.stream.write(data)
+        if "\n" in data or "\r" in data:
+            self.stream.flush()
+        return len(data)
 
-        def write(self, data):
-            for s in self.streams:
-                s.write(data)
-                s.flush()
+    def flush(self):
+        self.stream.flush()
+        self.logfile.flush()
 
-        def flush(self):
-            for s in self.streams:
-                s.flush()
+    def fileno(self):
+        """Return the file descriptor of the original stdout/stderr stream."""
+        # 원본 stdout/stderr의 fileno를 반환 (subprocess에서 필요)
+        return self.stream.fileno()
 
-        def fileno(self):
-            """Return the file descriptor of the first stream (original stdout/stderr)"""
-            # 원본 stdout/stderr의 fileno를 반환 (subprocess에서 필요)
-            return self.streams[0].fileno()
+
+def setup_logging():
+    """Redirect stdout and stderr to log files while keeping console output."""
+    log_dir = _get_log_directory()
+    logfile = _LogFile(log_dir)
 
     sys.stdout = Tee(sys.__stdout__, logfile)
     sys.stderr = Tee(sys.__stderr__, logfile)
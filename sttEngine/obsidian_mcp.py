@@ -7,7 +7,12 @@ STT 및 요약 텍스트를 Obsidian Vault에 자동으로 전송하는 기능 
 """
 
 import asyncio
+import atexit
+import functools
 import os
+import platform
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -18,9 +23,32 @@ from dotenv import load_dotenv
 # 환경 변수 로드
 load_dotenv()
 
+# frontmatter 중 호출마다 바뀌지 않는 부분
+_FRONTMATTER_PREFIX = '---\nauthor: 서요한\nfrom: "[[RecordRoute]]"\ncreated: '
+_FRONTMATTER_SUFFIX = "\naliases:\n    - {filename}\n    - {uuid}\n---\n\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _format_created(created_at: datetime) -> str:
+    """frontmatter용 생성 시각 문자열 (같은 초의 STT/요약 호출은 캐시 재사용)"""
+    return created_at.strftime("%Y-%m-%d %H%M%S")
+
+
+def _disabled_result() -> Dict[str, Any]:
+    """MCP 비활성화 시 반환하는 결과"""
+    return {
+        "success": False,
+        "message": "Obsidian MCP가 비활성화되어 있습니다.",
+        "action": "skipped"
+    }
+
 
 class ObsidianMCPIntegration:
-    """Obsidian MCP 서버와 통신하여 파일을 생성/업데이트하는 클래스"""
+    """Obsidian MCP 서버와 통신하여 파일을 생성/업데이트하는 클래스
+
+    MCP 서버 프로세스와 세션은 첫 호출 시 한 번 열어 이후 호출에서 재사용하며,
+    ``aclose()`` 또는 ``async with`` 블록 종료 시 정리된다.
+    """
 
     def __init__(self):
         """
@@ -44,6 +72,33 @@ class ObsidianMCPIntegration:
                 print("[Obsidian MCP] WARNING: OBSIDIAN_API_KEY가 설정되지 않았습니다.")
                 self.enabled = False
 
+        # MCP 서버 실행 설정 (환경변수는 생성 시 한 번만 읽는다)
+        self._server_env = {
+            "OBSIDIAN_API_KEY": self.api_key,
+            "PATH": os.environ.get("PATH", "")
+        }
+        self._server_params: Optional[StdioServerParameters] = None
+
+        # 재사용되는 MCP 세션 상태 (세션을 소유하는 태스크가 열고 닫는다)
+        self._session: Optional[ClientSession] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._closing: Optional[asyncio.Event] = None
+        # 이 인스턴스가 생성/추가한 Vault 파일 (존재 확인 RPC 생략용,
+        # append 실패나 세션 종료 시 비움).
+        # create 먼저 시도 후 충돌 시 append(EAFP)는 쓰지 않는다: Obsidian REST
+        # 백엔드에서 create는 기존 노트를 덮어쓰고 append는 없는 노트를 만들어
+        # 충돌 신호가 없다. 대신 세션이 열려 있는 동안 Obsidian에서 노트를
+        # 지우거나 이름을 바꾸면, append가 오류를 낼 때까지 있는 것으로 간주한다.
+        self._known_files: set = set()
+
+    async def __aenter__(self) -> "ObsidianMCPIntegration":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     def _generate_frontmatter(self, filename: str, uuid: str, created_at: datetime) -> str:
         """
         YAML frontmatter 생성
@@ -59,34 +114,80 @@ class ObsidianMCPIntegration:
         # 파일명에서 확장자 제거
         filename_without_ext = Path(filename).stem
 
-        return f"""---
-author: 서요한
-from: "[[RecordRoute]]"
-created: {created_at.strftime("%Y-%m-%d %H%M%S")}
-aliases:
-    - {filename_without_ext}
-    - {uuid}
----
-
-"""
+        return (
+            _FRONTMATTER_PREFIX
+            + _format_created(created_at.replace(microsecond=0))
+            + _FRONTMATTER_SUFFIX.format(filename=filename_without_ext, uuid=uuid)
+        )
 
     async def _get_server_params(self) -> StdioServerParameters:
-        """MCP 서버 파라미터 생성"""
-        # Windows 경로 정규화
-        import platform
-        server_path = self.server_path
-        if platform.system() == "Windows":
-            # Windows 경로를 정규화 (백슬래시 유지)
-            server_path = os.path.normpath(server_path)
-
-        return StdioServerParameters(
-            command=server_path,
-            args=[],
-            env={
-                "OBSIDIAN_API_KEY": self.api_key,
-                "PATH": os.getenv("PATH", "")
-            }
-        )
+        """MCP 서버 파라미터 생성 (프로세스 수명 동안 불변이므로 한 번만 생성)"""
+        if self._server_params is None:
+            server_path = self.server_path
+            if platform.system() == "Windows":
+                # Windows 경로를 정규화 (백슬래시 유지)
+                server_path = os.path.normpath(server_path)
+
+            self._server_params = StdioServerParameters(
+                command=server_path,
+                args=[],
+                env=self._server_env
+            )
+        return self._server_params
+
+    async def _run_session(self, ready: asyncio.Future) -> None:
+        """MCP 서버를 실행하고 ``aclose()`` 요청 전까지 세션을 유지"""
+        # stdio_client/ClientSession은 진입한 태스크에서 종료되어야 하므로
+        # 전용 태스크가 두 컨텍스트를 모두 소유한다.
+        try:
+            server_params = await self._get_server_params()
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self._session = session
+                    ready.set_result(session)
+                    await self._closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not isinstance(e, asyncio.CancelledError):
+                print(f"[Obsidian MCP] 세션 종료 중 오류: {e}")
+        finally:
+            self._session = None
+
+    async def _get_session(self) -> ClientSession:
+        """재사용 가능한 MCP 세션을 반환 (필요 시 서버를 실행)"""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # 다른 이벤트 루프(예: 이전 asyncio.run)에서 연 세션은 사용할 수 없다.
+            self._session = None
+            self._session_task = None
+            self._session_lock = asyncio.Lock()
+            self._session_loop = loop
+
+        async with self._session_lock:
+            if self._session is not None and not self._session_task.done():
+                return self._session
+
+            self._closing = asyncio.Event()
+            ready = loop.create_future()
+            self._session_task = loop.create_task(self._run_session(ready))
+            return await ready
+
+    async def aclose(self) -> None:
+        """열려 있는 MCP 세션과 서버 프로세스를 종료"""
+        # 세션을 다시 열면 Vault 상태를 새로 확인한다
+        self._known_files.clear()
+        task = self._session_task
+        if task is None or self._session_loop is not asyncio.get_running_loop():
+            return
+        self._session_task = None
+        self._session = None
+        self._closing.set()
+        try:
+            await task
+        except BaseException:
+            pass
 
     async def _file_exists(self, session: ClientSession, original_filename: str) -> bool:
         """
@@ -102,11 +203,14 @@ aliases:
         # 원본 파일명에서 확장자 제거하고 .md 추가
         filename_without_ext = Path(original_filename).stem
         filename = f"{self.vault_folder}/{filename_without_ext}.md"
+        if filename in self._known_files:
+            return True
         try:
             await session.call_tool("get_vault_file", {"filename": filename})
-            return True
         except Exception:
             return False
+        self._known_files.add(filename)
+        return True
 
     async def send_stt_to_obsidian(
         self,
@@ -131,11 +235,7 @@ aliases:
             결과 딕셔너리 {"success": bool, "message": str, "action": str}
         """
         if not self.enabled:
-            return {
-                "success": False,
-                "message": "Obsidian MCP가 비활성화되어 있습니다.",
-                "action": "skipped"
-            }
+            return _disabled_result()
 
         if created_at is None:
             created_at = datetime.now()
@@ -145,45 +245,48 @@ aliases:
         filename = f"{self.vault_folder}/{filename_without_ext}.md"
 
         try:
-            server_params = await self._get_server_params()
-
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-
-                    # 파일 존재 확인
-                    file_exists = await self._file_exists(session, original_filename)
-
-                    if file_exists:
-                        # 파일이 이미 있으면 STT 텍스트만 append
-                        content = f"\n\n## STT 원문\n\n{stt_text}\n"
-                        await session.call_tool("append_to_vault_file", {
-                            "filename": filename,
-                            "content": content
-                        })
-                        action = "appended"
-                        message = f"STT 텍스트가 기존 파일에 추가되었습니다: {filename}"
-                    else:
-                        # 새 파일 생성 (frontmatter + STT)
-                        frontmatter = self._generate_frontmatter(original_filename, uuid, created_at)
-                        content = f"{frontmatter}## STT 원문\n\n{stt_text}\n"
-
-                        await session.call_tool("create_vault_file", {
-                            "filename": filename,
-                            "content": content
-                        })
-                        action = "created"
-                        message = f"새 파일이 생성되었습니다: {filename}"
-
-                    print(f"[Obsidian MCP] ✓ {message}")
-                    return {
-                        "success": True,
-                        "message": message,
-                        "action": action,
-                        "filename": filename
-                    }
+            session = await self._get_session()
+
+            # 파일 존재 확인
+            file_exists = await self._file_exists(session, original_filename)
+
+            if file_exists:
+                # 파일이 이미 있으면 STT 텍스트만 append
+                content = f"\n\n## STT 원문\n\n{stt_text}\n"
+                result = await session.call_tool("append_to_vault_file", {
+                    "filename": filename,
+                    "content": content
+                })
+                if getattr(result, "isError", False):
+                    # Vault에서 파일이 지워졌으면 캐시에서 빼고 새로 생성
+                    self._known_files.discard(filename)
+                    file_exists = False
+                else:
+                    action = "appended"
+                    message = f"STT 텍스트가 기존 파일에 추가되었습니다: {filename}"
+            if not file_exists:
+                # 새 파일 생성 (frontmatter + STT)
+                frontmatter = self._generate_frontmatter(original_filename, uuid, created_at)
+                content = f"{frontmatter}## STT 원문\n\n{stt_text}\n"
+
+                await session.call_tool("create_vault_file", {
+                    "filename": filename,
+                    "content": content
+                })
+                action = "created"
+                message = f"새 파일이 생성되었습니다: {filename}"
+
+            self._known_files.add(filename)
+            print(f"[Obsidian MCP] ✓ {message}")
+            return {
+                "success": True,
+                "message": message,
+                "action": action,
+                "filename": filename
+            }
 
         except FileNotFoundError as e:
+            await self.aclose()
             error_msg = f"MCP 서버를 찾을 수 없습니다: {self.server_path}"
             print(f"[Obsidian MCP] ✗ {error_msg}")
             print(f"[Obsidian MCP] 힌트: OBSIDIAN_MCP_SERVER_PATH 환경변수를 확인하세요.")
@@ -193,6 +296,8 @@ aliases:
                 "action": "failed"
             }
         except Exception as e:
+            # 세션이 끊겼을 수 있으므로 다음 호출에서 새로 연결
+            await self.aclose()
             error_msg = f"Obsidian MCP 전송 실패: {str(e)}"
             print(f"[Obsidian MCP] ✗ {error_msg}")
             import traceback
@@ -229,11 +334,7 @@ aliases:
             결과 딕셔너리
         """
         if not self.enabled:
-            return {
-                "success": False,
-                "message": "Obsidian MCP가 비활성화되어 있습니다.",
-                "action": "skipped"
-            }
+            return _disabled_result()
 
         if created_at is None:
             created_at = datetime.now()
@@ -243,46 +344,49 @@ aliases:
         filename = f"{self.vault_folder}/{filename_without_ext}.md"
 
         try:
-            server_params = await self._get_server_params()
-
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-
-                    # 파일 존재 확인
-                    file_exists = await self._file_exists(session, original_filename)
-
-                    if file_exists:
-                        # 파일이 있으면 요약만 append
-                        content = f"\n\n## 요약\n\n{summary_text}\n"
-                        await session.call_tool("append_to_vault_file", {
-                            "filename": filename,
-                            "content": content
-                        })
-                        action = "appended"
-                        message = f"요약이 기존 파일에 추가되었습니다: {filename}"
-                    else:
-                        # 파일이 없으면 새로 생성 (frontmatter + 요약)
-                        # STT 없이 바로 요약된 케이스
-                        frontmatter = self._generate_frontmatter(original_filename, uuid, created_at)
-                        content = f"{frontmatter}## 요약\n\n{summary_text}\n"
-
-                        await session.call_tool("create_vault_file", {
-                            "filename": filename,
-                            "content": content
-                        })
-                        action = "created"
-                        message = f"새 파일이 생성되었습니다 (요약만): {filename}"
-
-                    print(f"[Obsidian MCP] ✓ {message}")
-                    return {
-                        "success": True,
-                        "message": message,
-                        "action": action,
-                        "filename": filename
-                    }
+            session = await self._get_session()
+
+            # 파일 존재 확인
+            file_exists = await self._file_exists(session, original_filename)
+
+            if file_exists:
+                # 파일이 있으면 요약만 append
+                content = f"\n\n## 요약\n\n{summary_text}\n"
+                result = await session.call_tool("append_to_vault_file", {
+                    "filename": filename,
+                    "content": content
+                })
+                if getattr(result, "isError", False):
+                    # Vault에서 파일이 지워졌으면 캐시에서 빼고 새로 생성
+                    self._known_files.discard(filename)
+                    file_exists = False
+                else:
+                    action = "appended"
+                    message = f"요약이 기존 파일에 추가되었습니다: {filename}"
+            if not file_exists:
+                # 파일이 없으면 새로 생성 (frontmatter + 요약)
+                # STT 없이 바로 요약된 케이스
+                frontmatter = self._generate_frontmatter(original_filename, uuid, created_at)
+                content = f"{frontmatter}## 요약\n\n{summary_text}\n"
+
+                await session.call_tool("create_vault_file", {
+                    "filename": filename,
+                    "content": content
+                })
+                action = "created"
+                message = f"새 파일이 생성되었습니다 (요약만): {filename}"
+
+            self._known_files.add(filename)
+            print(f"[Obsidian MCP] ✓ {message}")
+            return {
+                "success": True,
+                "message": message,
+                "action": action,
+                "filename": filename
+            }
 
         except FileNotFoundError as e:
+            await self.aclose()
             error_msg = f"MCP 서버를 찾을 수 없습니다: {self.server_path}"
             print(f"[Obsidian MCP] ✗ {error_msg}")
             print(f"[Obsidian MCP] 힌트: OBSIDIAN_MCP_SERVER_PATH 환경변수를 확인하세요.")
@@ -292,6 +396,8 @@ aliases:
                 "action": "failed"
             }
         except Exception as e:
+            # 세션이 끊겼을 수 있으므로 다음 호출에서 새로 연결
+            await self.aclose()
             error_msg = f"Obsidian MCP 전송 실패: {str(e)}"
             print(f"[Obsidian MCP] ✗ {error_msg}")
             import traceback
@@ -311,6 +417,72 @@ aliases:
 
 
 # 동기 래퍼 함수들 (기존 동기 코드에서 사용)
+# 모든 동기 호출은 백그라운드 스레드의 영속 이벤트 루프와 하나의
+# ObsidianMCPIntegration 인스턴스를 공유하여 MCP 세션을 재사용한다.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_integration: Optional[ObsidianMCPIntegration] = None
+_sync_lock = threading.Lock()
+# 동기 호출 하나가 기다리는 최대 시간 (초). MCP 서버가 멈춰도 호출자가 막히지 않게 한다.
+SYNC_CALL_TIMEOUT = float(os.getenv("OBSIDIAN_MCP_TIMEOUT", "60"))
+
+
+def _get_sync_runtime() -> tuple:
+    """공유 이벤트 루프와 통합 인스턴스를 반환 (최초 호출 시 생성)
+
+    통합이 비활성화되어 있으면 루프 스레드를 시작하지 않고 루프 자리에 None을 반환한다.
+    """
+    global _sync_loop, _sync_integration
+    with _sync_lock:
+        if _sync_integration is None:
+            _sync_integration = ObsidianMCPIntegration()
+        if _sync_loop is None and _sync_integration.is_enabled():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="obsidian-mcp-loop", daemon=True
+            ).start()
+            _sync_loop = loop
+            atexit.register(_close_sync_runtime)
+        return _sync_loop, _sync_integration
+
+
+def _close_sync_runtime() -> None:
+    """프로세스 종료 시 공유 MCP 세션을 정리"""
+    if _sync_loop is None or _sync_integration is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_sync_integration.aclose(), _sync_loop).result(timeout=5)
+    except Exception:
+        pass
+    _sync_loop.call_soon_threadsafe(_sync_loop.stop)
+
+
+def _run_sync(make_coro) -> Dict[str, Any]:
+    """공유 루프에서 ``make_coro(integration)``을 실행하고 결과를 기다림
+
+    시간 초과 시 세션을 재설정한다.
+    """
+    loop, integration = _get_sync_runtime()
+    if loop is None:
+        return _disabled_result()
+    future = asyncio.run_coroutine_threadsafe(make_coro(integration), loop)
+    try:
+        return future.result(timeout=SYNC_CALL_TIMEOUT)
+    except FutureTimeoutError:
+        future.cancel()
+        # 응답 없는 세션은 닫고 다음 호출에서 새로 연결
+        try:
+            asyncio.run_coroutine_threadsafe(integration.aclose(), loop).result(timeout=5)
+        except Exception:
+            pass
+        error_msg = f"Obsidian MCP 응답 시간 초과 ({SYNC_CALL_TIMEOUT:g}초)"
+        print(f"[Obsidian MCP] ✗ {error_msg}")
+        return {
+            "success": False,
+            "message": error_msg,
+            "action": "failed"
+        }
+
+
 def send_stt_to_obsidian_sync(
     uuid: str,
     stt_text: str,
@@ -329,8 +501,7 @@ def send_stt_to_obsidian_sync(
     Returns:
         결과 딕셔너리
     """
-    integration = ObsidianMCPIntegration()
-    return asyncio.run(integration.send_stt_to_obsidian(
+    return _run_sync(lambda integration: integration.send_stt_to_obsidian(
         uuid, stt_text, original_filename, created_at
     ))
 
@@ -353,8 +524,7 @@ def send_summary_to_obsidian_sync(
     Returns:
         결과 딕셔너리
     """
-    integration = ObsidianMCPIntegration()
-    return asyncio.run(integration.send_summary_to_obsidian(
+    return _run_sync(lambda integration: integration.send_summary_to_obsidian(
         uuid, summary_text, original_filename, created_at
     ))
 
@@ -375,22 +545,25 @@ if __name__ == "__main__":
 
         print(f"\nTest UUID: {test_uuid}")
 
-        # STT 전송 테스트
-        print("\n1. STT 전송 테스트...")
-        result = asyncio.run(integration.send_stt_to_obsidian(
-            uuid=test_uuid,
-            stt_text="이것은 테스트 STT 텍스트입니다.",
-            original_filename="test_audio.m4a"
-        ))
-        print(f"Result: {result}")
-
-        # 요약 전송 테스트
-        print("\n2. 요약 전송 테스트...")
-        result = asyncio.run(integration.send_summary_to_obsidian(
-            uuid=test_uuid,
-            summary_text="## 테스트 요약\n\n- 핵심 내용 1\n- 핵심 내용 2",
-            original_filename="test_audio.m4a"
-        ))
-        print(f"Result: {result}")
+        async def run_test():
+            # 하나의 세션으로 STT와 요약을 연속 전송
+            async with integration:
+                print("\n1. STT 전송 테스트...")
+                result = await integration.send_stt_to_obsidian(
+                    uuid=test_uuid,
+                    stt_text="이것은 테스트 STT 텍스트입니다.",
+                    original_filename="test_audio.m4a"
+                )
+                print(f"Result: {result}")
+
+                print("\n2. 요약 전송 테스트...")
+                result = await integration.send_summary_to_obsidian(
+                    uuid=test_uuid,
+                    summary_text="## 테스트 요약\n\n- 핵심 내용 1\n- 핵심 내용 2",
+                    original_filename="test_audio.m4a"
+                )
+                print(f"Result: {result}")
+
+        asyncio.run(run_test())
     else:
         print("\nMCP가 비활성화되어 있어 테스트를 건너뜁니다.")
@@ -5,6 +5,9 @@ import ollama
 from workflow.summarize import read_text_with_fallback, DEFAULT_MODEL
 from ollama_utils import safe_ollama_call
 
+# Only the beginning of the transcript is sent to the model.
+SUMMARY_INPUT_CHARS = 4000
+
 
 def generate_one_line_summary(file_path: Path, model: str = None) -> str:
     """Generate a single-line Korean summary for the given text file.
@@ -17,8 +20,8 @@ def generate_one_line_summary(file_path: Path, model: str = None) -> str:
     Returns:
         A one-line summary string.
     """
-    text = read_text_with_fallback(file_path)
-    prompt = "다음 텍스트를 한 줄로 한국어로 요약해 주세요:\n" + text[:4000]
+    text = read_text_with_fallback(file_path, max_chars=SUMMARY_INPUT_CHARS)
+    prompt = "다음 텍스트를 한 줄로 한국어로 요약해 주세요:\n" + text
     response = safe_ollama_call(
         ollama.generate,
         model=model or DEFAULT_MODEL,
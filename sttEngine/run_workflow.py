@@ -1,12 +1,14 @@
 # run_workflow.py
+import codecs
 import os
 import sys
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from logger import setup_logging
-from config import get_db_base_path
+from config import get_config_value, get_db_base_path
 
 setup_logging()
 
@@ -22,22 +24,48 @@ OUTPUT_DIR = DB_BASE_PATH / "whisper_output"
 WORKFLOW_DIR = BASE_DIR / "workflow"
 TRANSCRIBE_SCRIPT = WORKFLOW_DIR / "transcribe.py"
 SUMMARIZE_SCRIPT = WORKFLOW_DIR / "summarize.py"
-
-def run_command(command):
-    """주어진 명령어를 실행하고 진행 상황을 출력합니다."""
-    print(f"\n--- 실행: {" ".join(map(str, command))} ---")
+# transcribe.py가 새로 만든 파일을 알릴 때 쓰는 접두어 (workflow/transcribe.py와 동일)
+NEW_FILE_MARKER = "NEW_FILE: "
+# 하위 프로세스 출력을 한 번에 읽을 바이트 수
+READ_CHUNK_SIZE = 1 << 16
+# 동시에 실행할 요약 프로세스 수 (GPU 한 대로 Ollama를 쓰는 경우 1 권장)
+MAX_PARALLEL = max(1, get_config_value("WORKFLOW_MAX_PARALLEL", min(2, os.cpu_count() or 1), int))
+
+def run_command(command, captured_lines=None):
+    """주어진 명령어를 실행하고 진행 상황을 출력합니다.
+
+    하위 프로세스의 출력은 파이프로 받아 이 프로세스의 stdout(로그 포함)으로
+    전달합니다. captured_lines 리스트를 넘기면 출력의 각 줄을 그 리스트에도
+    추가합니다.
+    """
+    print(f"\n--- 실행: {' '.join(map(str, command))} ---")
     try:
         # 실시간 출력을 위해 Popen 사용 (Windows 호환성 개선)
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                 text=True, encoding='utf-8', shell=platform.system() == "Windows")
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                 bufsize=0, shell=platform.system() == "Windows")
+        # 줄 단위 readline 대신 큰 청크로 읽고, 완성된 줄만 한 번에 출력
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        fd = process.stdout.fileno()
+        pending = ""
         while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
                 break
-            if output:
-                print(output.strip())
-        
-        rc = process.poll()
+            text = pending + decoder.decode(chunk)
+            end = text.rfind("\n") + 1
+            if end:
+                sys.stdout.write(text[:end])
+                if captured_lines is not None:
+                    captured_lines.extend(text[:end].splitlines())
+            pending = text[end:]
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            sys.stdout.write(pending + "\n")
+            if captured_lines is not None:
+                captured_lines.append(pending)
+        process.stdout.close()
+
+        rc = process.wait()
         if rc != 0:
             print(f"오류: 명령어가 비정상적으로 종료되었습니다 (종료 코드: {rc})")
             return False
@@ -49,6 +77,19 @@ def run_command(command):
         print(f"명령어 실행 중 예외 발생: {e}")
         return False
 
+def run_script_parallel(script, files, max_parallel=MAX_PARALLEL):
+    """파일들을 최대 max_parallel개의 프로세스로 나누어 스크립트를 동시에 실행합니다."""
+    workers = min(max_parallel, len(files))
+    if workers <= 1:
+        return run_command([PYTHON_EXEC, script, *files])
+
+    batches = [files[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda batch: run_command([PYTHON_EXEC, script, *batch]), batches
+        ))
+    return all(results)
+
 def run_transcription():
     """STT 변환 단계를 실행하고 생성된 원본 마크다운 파일 목록을 반환합니다."""
     while True:
@@ -60,14 +101,18 @@ def run_transcription():
             print(f"오류: '{input_path_str}'는 유효한 폴더가 아닙니다. 다시 입력해주세요.")
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    files_before = set(OUTPUT_DIR.glob("*.md"))
 
-    if not run_command([PYTHON_EXEC, TRANSCRIBE_SCRIPT, input_path]):
+    # transcribe.py가 stdout으로 알려 주는 생성 파일 목록을 사용 (디렉토리 재탐색 불필요)
+    output_lines = []
+    if not run_command([PYTHON_EXEC, TRANSCRIBE_SCRIPT, input_path], captured_lines=output_lines):
         print("음성 변환 단계에서 오류가 발생하여 중단합니다.")
         return []
 
-    files_after = set(OUTPUT_DIR.glob("*.md"))
-    newly_created_files = list(files_after - files_before)
+    newly_created_files = [
+        Path(line[len(NEW_FILE_MARKER):].strip())
+        for line in output_lines
+        if line.startswith(NEW_FILE_MARKER)
+    ]
 
     files_to_process = [p for p in newly_created_files if not p.name.endswith(('.corrected.md', '.summary.md'))]
 
@@ -126,10 +171,10 @@ def main():
             return
         
         print(f"총 {len(files_to_process)}개 파일에 대해 요약을 진행합니다.")
-        for file_path in files_to_process:
-            if not run_command([PYTHON_EXEC, SUMMARIZE_SCRIPT, file_path]):
-                print(f"{file_path.name} 요약 중 오류가 발생하여 중단합니다.")
-                return
+        # 파일마다 인터프리터를 새로 띄우지 않고 소수의 프로세스로 나누어 동시에 요약
+        if not run_script_parallel(SUMMARIZE_SCRIPT, files_to_process):
+            print("요약 중 오류가 발생하여 중단합니다.")
+            return
 
     print("\n--- 모든 요청된 작업이 성공적으로 완료되었습니다. ---")
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import hashlib
 
+import numpy as np
+
 try:  # pragma: no cover - import resolution for both package/script execution
     from .config import DB_ALIAS, get_db_base_path
 except Exception:  # pragma: no cover - fallback when imported as a script
@@ -16,6 +21,11 @@ except Exception:  # pragma: no cover - fallback when imported as a script
         DB_ALIAS = "DB"  # type: ignore
         get_db_base_path = None  # type: ignore
 
+try:  # pragma: no cover - import resolution for both package/script execution
+    from .json_store import read_json, write_json
+except ImportError:  # pragma: no cover - fallback when imported as a script
+    from json_store import read_json, write_json  # type: ignore
+
 
 def _resolve_cache_directory() -> Path:
     """Return the cache directory derived from the configured DB base path."""
@@ -41,13 +51,81 @@ CACHE_DIR = _resolve_cache_directory()
 # 캐시 만료 시간 (24시간)
 CACHE_EXPIRY_HOURS = 24
 
+# 캐시 항목의 해시/저장 시각을 보관하는 SQLite 인덱스
+# 정리/통계 시 캐시 파일을 하나씩 열어 파싱하지 않고 인덱스만 조회한다.
+CACHE_INDEX_PATH = CACHE_DIR / "index.db"
+
+_index_conn: Optional[sqlite3.Connection] = None
+_index_lock = threading.Lock()
+
+# 조회 경로에서 만료 캐시 정리를 실행하는 최소 간격 (초)
+CACHE_CLEANUP_INTERVAL = 3600
+
+_last_cleanup = 0.0
+_cleanup_lock = threading.Lock()
+
+# 쿼리 해시 -> 검색 UUID (캐시 재저장 시 UUID 유지용, 디스크 조회 생략)
+_HASH_TO_UUID: Dict[str, str] = {}
+
+
+def _timestamp_to_epoch(timestamp: Any) -> Optional[float]:
+    """캐시 타임스탬프를 epoch 초로 변환 (실패 시 None)
+
+    새 레코드는 epoch 초(float)를 저장하며, 이전 버전의 ISO 문자열도 읽을 수 있다.
+    """
+    if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+        return float(timestamp)
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+
+def _backfill_index(conn: sqlite3.Connection) -> None:
+    """인덱스 도입 이전에 저장된 캐시 파일들을 인덱스에 등록"""
+    rows = []
+    for cache_file in CACHE_DIR.glob("*.json"):
+        try:
+            record = read_json(cache_file)
+            ts = _timestamp_to_epoch(record.get('timestamp'))
+        except (json.JSONDecodeError, IOError, AttributeError):
+            ts = None
+        # 잘못된 파일은 ts=0으로 등록하여 다음 정리 때 삭제되도록 함
+        rows.append((cache_file.stem, ts or 0.0))
+    if rows:
+        conn.executemany("INSERT OR REPLACE INTO cache(hash, ts) VALUES (?, ?)", rows)
+
+
+def _get_index() -> sqlite3.Connection:
+    """캐시 인덱스 연결 반환 (최초 호출 시 생성). _index_lock을 잡은 상태에서 호출"""
+    global _index_conn
+    if _index_conn is None:
+        created = not CACHE_INDEX_PATH.exists()
+        conn = sqlite3.connect(CACHE_INDEX_PATH, check_same_thread=False, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+        conn.execute("CREATE TABLE IF NOT EXISTS cache(hash TEXT PRIMARY KEY, ts REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_ts ON cache(ts)")
+        if created:
+            _backfill_index(conn)
+        _index_conn = conn
+    return _index_conn
+
+
+def _expiry_cutoff() -> float:
+    """이 시각(epoch 초)보다 이전에 저장된 캐시는 만료된 것으로 간주"""
+    return time.time() - CACHE_EXPIRY_HOURS * 3600
+
 
 def get_query_hash(query: str, top_k: int,
                    start_date: Optional[str] = None,
                    end_date: Optional[str] = None) -> str:
     """검색 쿼리와 파라미터에 대한 해시값 생성"""
     query_data = f"{query}:{top_k}:{start_date or ''}:{end_date or ''}"
-    return hashlib.md5(query_data.encode('utf-8')).hexdigest()
+    # 보안 용도가 아닌 파일명 키이므로 더 빠른 BLAKE2b(128비트, 32자리 hex) 사용
+    return hashlib.blake2b(query_data.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def load_cache_record(query_hash: str) -> Optional[Dict[str, Any]]:
@@ -57,42 +135,60 @@ def load_cache_record(query_hash: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            record = json.load(f)
-        return record
+        record = read_json(cache_file)
     except (json.JSONDecodeError, IOError):
         return None
+    if isinstance(record, dict) and record.get('uuid'):
+        _HASH_TO_UUID[query_hash] = record['uuid']
+    return record
 
 
 def save_cache_record(query_hash: str, record: Dict[str, Any]) -> None:
     """캐시 레코드 저장"""
     cache_file = CACHE_DIR / f"{query_hash}.json"
     try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(record, f, ensure_ascii=False, indent=2)
+        # 검색 시마다 읽히므로 들여쓰기 없이 압축된 형태로 저장
+        write_json(cache_file, record, indent=False)
     except IOError:
+        return
+    if record.get('uuid'):
+        _HASH_TO_UUID[query_hash] = record['uuid']
+
+    ts = _timestamp_to_epoch(record.get('timestamp')) or time.time()
+    try:
+        with _index_lock:
+            _get_index().execute(
+                "INSERT OR REPLACE INTO cache(hash, ts) VALUES (?, ?)", (query_hash, ts)
+            )
+    except sqlite3.Error:
         pass
 
 
-def is_cache_expired(timestamp_str: str) -> bool:
+def is_cache_expired(timestamp: Any) -> bool:
     """캐시가 만료되었는지 확인 (24시간 기준)"""
-    try:
-        cache_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        if cache_time.tzinfo is None:
-            cache_time = cache_time.replace(tzinfo=None)
-        current_time = datetime.now()
-        
-        return (current_time - cache_time) > timedelta(hours=CACHE_EXPIRY_HOURS)
-    except (ValueError, AttributeError):
+    cache_time = _timestamp_to_epoch(timestamp)
+    if cache_time is None:
         return True
+    return (time.time() - cache_time) > CACHE_EXPIRY_HOURS * 3600
+
+
+def _schedule_cleanup() -> None:
+    """마지막 정리 후 CACHE_CLEANUP_INTERVAL이 지났으면 백그라운드 정리 시작"""
+    global _last_cleanup
+    now = time.monotonic()
+    with _cleanup_lock:
+        if _last_cleanup and now - _last_cleanup < CACHE_CLEANUP_INTERVAL:
+            return
+        _last_cleanup = now
+    threading.Thread(target=cleanup_expired_cache, name="search-cache-cleanup", daemon=True).start()
 
 
 def get_cached_search_result(query: str, top_k: int,
                              start_date: Optional[str] = None,
                              end_date: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
     """캐시된 검색 결과 조회"""
-    # 캐시 사용 전 만료된 항목을 정리하여 디스크 사용량을 관리
-    cleanup_expired_cache()
+    # 디스크 사용량 관리를 위한 만료 캐시 정리는 시간당 한 번만 백그라운드에서 수행
+    _schedule_cleanup()
 
     query_hash = get_query_hash(query, top_k, start_date, end_date)
     record = load_cache_record(query_hash)
@@ -100,7 +196,7 @@ def get_cached_search_result(query: str, top_k: int,
     if not record:
         return None
     
-    if is_cache_expired(record.get('timestamp', '')):
+    if is_cache_expired(record.get('timestamp')):
         return None
     
     return record.get('results', [])
@@ -116,6 +212,8 @@ def cache_search_result(query: str, top_k: int, results: List[Dict[str, Any]],
     # 기존 UUID 유지하거나 새로 생성
     if existing_uuid:
         search_uuid = existing_uuid
+    elif query_hash in _HASH_TO_UUID:
+        search_uuid = _HASH_TO_UUID[query_hash]
     else:
         # 기존 캐시 레코드에서 UUID 추출 시도
         existing_record = load_cache_record(query_hash)
@@ -128,7 +226,7 @@ def cache_search_result(query: str, top_k: int, results: List[Dict[str, Any]],
         "uuid": search_uuid,
         "query": query,
         "top_k": top_k,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": time.time(),
         "query_hash": query_hash,
         "results": results,
         "start_date": start_date,
@@ -145,6 +243,14 @@ def delete_cache_record(query: str, top_k: int,
     """Delete cached search result for a given query."""
     query_hash = get_query_hash(query, top_k, start_date, end_date)
     cache_file = CACHE_DIR / f"{query_hash}.json"
+    _HASH_TO_UUID.pop(query_hash, None)
+    # 새로고침 요청이 유사 쿼리 캐시에서 같은 결과를 다시 받지 않도록 비움
+    SEMANTIC_CACHE.clear()
+    try:
+        with _index_lock:
+            _get_index().execute("DELETE FROM cache WHERE hash = ?", (query_hash,))
+    except sqlite3.Error:
+        pass
     try:
         cache_file.unlink()
         return True
@@ -157,23 +263,26 @@ def cleanup_expired_cache() -> int:
     cleaned = 0
     if not CACHE_DIR.exists():
         return cleaned
-    
-    for cache_file in CACHE_DIR.glob("*.json"):
+
+    cutoff = _expiry_cutoff()
+    try:
+        with _index_lock:
+            conn = _get_index()
+            expired = [row[0] for row in conn.execute("SELECT hash FROM cache WHERE ts < ?", (cutoff,))]
+            if not expired:
+                return cleaned
+            conn.execute("DELETE FROM cache WHERE ts < ?", (cutoff,))
+    except sqlite3.Error:
+        return cleaned
+
+    for query_hash in expired:
+        _HASH_TO_UUID.pop(query_hash, None)
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                record = json.load(f)
-            
-            if is_cache_expired(record.get('timestamp', '')):
-                cache_file.unlink()
-                cleaned += 1
-        except (json.JSONDecodeError, IOError, KeyError):
-            # 잘못된 캐시 파일도 삭제
-            try:
-                cache_file.unlink()
-                cleaned += 1
-            except OSError:
-                pass
-    
+            (CACHE_DIR / f"{query_hash}.json").unlink()
+            cleaned += 1
+        except OSError:
+            pass
+
     return cleaned
 
 
@@ -182,23 +291,157 @@ def get_cache_stats() -> Dict[str, Any]:
     if not CACHE_DIR.exists():
         return {"total_entries": 0, "expired_entries": 0, "valid_entries": 0}
     
-    total = 0
-    expired = 0
-    
-    for cache_file in CACHE_DIR.glob("*.json"):
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                record = json.load(f)
-            
-            total += 1
-            if is_cache_expired(record.get('timestamp', '')):
-                expired += 1
-        except (json.JSONDecodeError, IOError, KeyError):
-            total += 1
-            expired += 1  # 잘못된 파일도 만료된 것으로 간주
-    
+    try:
+        with _index_lock:
+            conn = _get_index()
+            total = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            # 잘못된 파일은 ts=0으로 등록되므로 만료된 것으로 집계됨
+            expired = conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE ts < ?", (_expiry_cutoff(),)
+            ).fetchone()[0]
+    except sqlite3.Error:
+        total = expired = 0
+
     return {
         "total_entries": total,
         "expired_entries": expired,
         "valid_entries": total - expired
-    }
\ No newline at end of file
+    }
+
+
+# 유사 쿼리 캐시 설정: 코사인 유사도 기준값과 최대 항목 수
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_MAX_ENTRIES = 5000
+
+
+class SemanticCache:
+    """쿼리 임베딩의 코사인 유사도로 벡터 검색 결과를 재사용하는 메모리 캐시
+
+    같은 검색 조건(``key``: top_k, 날짜 범위) 안에서 ``threshold`` 이상 유사한
+    이전 쿼리가 있으면 그 결과를 반환한다. 항목 수가 ``max_entries``에 도달하면
+    가장 오래 사용되지 않은 항목을 교체하고, ``ttl`` 초가 지난 항목은 무시한다.
+
+    결과는 검색한 인덱스의 버전(``version``)에 묶인다. 다른 버전으로 조회하거나
+    저장하면 이전 항목은 모두 버려진다.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+                 ttl: float = CACHE_EXPIRY_HOURS * 3600) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._version: Any = None
+        self.clear()
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            # 행 i: 정규화된 쿼리 임베딩, 조건 id, 저장/사용 시각, 결과
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+            self._key_ids = np.empty(0, dtype=np.int64)
+            self._created = np.empty(0, dtype=np.float64)
+            self._last_used = np.empty(0, dtype=np.float64)
+            self._results: List[List[Dict[str, Any]]] = []
+            self._key_index: Dict[Tuple[Any, ...], int] = {}
+            self._size = 0
+
+    @staticmethod
+    def _normalize(vector: Any) -> Optional[np.ndarray]:
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        if not norm:
+            return None
+        return vec / norm
+
+    def _is_live(self, row: int, key_id: int, vec: np.ndarray, now: float) -> bool:
+        return (
+            row < self._size
+            and self._key_ids[row] == key_id
+            and now - self._created[row] <= self.ttl
+            and float(self._matrix[row] @ vec) >= self.threshold
+        )
+
+    def _check_version(self, version: Any) -> None:
+        # 인덱스가 바뀌었으면 이전 결과는 삭제/변경된 문서를 가리킬 수 있음
+        if version != self._version:
+            self.clear()
+            self._version = version
+
+    def get(self, key: Tuple[Any, ...], vector: Any,
+            version: Any = None) -> Optional[List[Dict[str, Any]]]:
+        """``key`` 조건에서 ``vector``와 충분히 유사한 쿼리의 결과 반환 (없으면 None)"""
+        vec = self._normalize(vector)
+        if vec is None:
+            return None
+        with self._lock:
+            self._check_version(version)
+            key_id = self._key_index.get(key)
+            size = self._size
+            if key_id is None or not size or self._matrix.shape[1] != vec.shape[0]:
+                return None
+            matrix = self._matrix
+            key_ids = self._key_ids[:size].copy()
+            created = self._created[:size].copy()
+
+        # 행렬 곱은 잠금 밖에서 수행 (교체된 행은 아래에서 다시 확인)
+        now = time.time()
+        scores = matrix[:size] @ vec
+        scores[(key_ids != key_id) | (now - created > self.ttl)] = -np.inf
+        row = int(np.argmax(scores))
+        if scores[row] < self.threshold:
+            return None
+
+        with self._lock:
+            if self._matrix is not matrix or not self._is_live(row, key_id, vec, now):
+                return None
+            self._last_used[row] = now
+            return [dict(item) for item in self._results[row]]
+
+    def put(self, key: Tuple[Any, ...], vector: Any, results: List[Dict[str, Any]],
+            version: Any = None) -> None:
+        """``key`` 조건의 쿼리 임베딩과 ``version`` 인덱스에서 얻은 검색 결과 저장"""
+        vec = self._normalize(vector)
+        if vec is None:
+            return
+        with self._lock:
+            self._check_version(version)
+            if self._size and self._matrix.shape[1] != vec.shape[0]:
+                # 임베딩 모델이 바뀐 경우 이전 벡터와 비교할 수 없음
+                self.clear()
+            key_id = self._key_index.setdefault(key, len(self._key_index))
+
+            if self._size < self.max_entries:
+                row = self._size
+                if row >= len(self._matrix):
+                    self._grow(vec.shape[0])
+                self._size += 1
+                self._results.append([])
+            else:
+                row = int(np.argmin(self._last_used[:self._size]))
+
+            now = time.time()
+            self._matrix[row] = vec
+            self._key_ids[row] = key_id
+            self._created[row] = now
+            self._last_used[row] = now
+            self._results[row] = [dict(item) for item in results]
+
+    def _grow(self, dim: int) -> None:
+        """용량을 두 배로 늘린 새 배열로 교체 (진행 중인 조회는 이전 배열을 계속 사용)"""
+        capacity = min(self.max_entries, max(16, 2 * len(self._matrix)))
+        size = self._size
+        matrix = np.empty((capacity, dim), dtype=np.float32)
+        if size:
+            matrix[:size] = self._matrix[:size]
+        self._matrix = matrix
+        for name in ("_key_ids", "_created", "_last_used"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:size] = old[:size]
+            setattr(self, name, new)
+
+
+# 벡터 검색에서 사용하는 유사 쿼리 캐시
+SEMANTIC_CACHE = SemanticCache()
@@ -10,13 +10,17 @@ Only selected workflow steps return download links.
 """
 
 from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import errno
 import json
 import os
 import subprocess
 import sys
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import re
 from urllib.parse import unquote
 
@@ -31,13 +35,24 @@ import threading
 import time
 import shutil
 import hashlib
+import tempfile
 import asyncio
+import functools
+import heapq
 import websockets
 
+try:
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MutagenFile = None
+    MUTAGEN_AVAILABLE = False
+
 from .workflow.transcribe import transcribe_audio_files
 from .workflow.summarize import (
     summarize_text_mapreduce,
     read_text_with_fallback,
+    decode_text_with_fallback,
     save_output,
     DEFAULT_MODEL,
     DEFAULT_CHUNK_SIZE,
@@ -49,13 +64,29 @@ from .config import (
     get_db_base_path,
     get_default_model,
     normalize_db_record_path,
+    relative_path_or_none,
     resolve_db_path,
     to_db_record_path,
 )
 from .one_line_summary import generate_one_line_summary
 from .vector_search import search as search_vectors
 from .search_cache import cleanup_expired_cache, get_cache_stats, delete_cache_record
-from .embedding_pipeline import embed_text_ollama, load_index, save_index
+from .embedding_pipeline import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_WORKERS,
+    embed_text_ollama,
+    embed_texts_ollama,
+    file_hash,
+    file_hashes,
+    entry_matches_stat,
+    compact_index,
+    index_key_for_path,
+    load_index,
+    save_index,
+    save_index_entry,
+    save_index_entries,
+)
+from .json_store import read_json, write_json
 from ollama_utils import ensure_ollama_server, check_ollama_model_available
 import numpy as np
 import os
@@ -73,7 +104,32 @@ DELETED_UPLOAD_DIR = DELETED_DIR / "uploads"
 DELETED_OUTPUT_DIR = DELETED_DIR / "whisper_output"
 DELETED_VECTOR_DIR = DELETED_DIR / "vector_store"
 SEARCHABLE_SUFFIXES = {".md", ".txt", ".text", ".markdown"}
+# Uploads are streamed from the socket to disk in chunks of this size.
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Upper bound for the headers of a single multipart part.
+MULTIPART_HEADER_LIMIT = 16 * 1024
 TASK_TYPES = ("stt", "embedding", "summary")
+# Read-only template for completion flags; copy it instead of rebuilding.
+_EMPTY_TASKS: dict[str, bool] = {task: False for task in TASK_TYPES}
+
+
+@dataclass
+class _RegistryCache:
+    """Parsed file registry plus path data derived from it on demand."""
+
+    signature: tuple[int, int]
+    registry: dict
+    # uuid -> (stored file_path, normalized record path, resolved path)
+    entry_paths: dict[str, tuple[str, str, Path | None]] | None = None
+    # resolved path string -> first uuid registered for it
+    path_index: dict[str, str] | None = None
+
+
+# Parsed file registry keyed by path, invalidated by (mtime_ns, size)
+_REGISTRY_CACHE: dict[Path, _RegistryCache] = {}
+
+# Read-only upload history snapshots keyed by path, invalidated the same way
+_HISTORY_CACHE: dict[Path, tuple[tuple[int, int], "HistoryView"]] = {}
 
 # Global dictionary to track running processes
 running_processes = {}
@@ -87,6 +143,13 @@ progress_lock = threading.Lock()
 connected_clients = set()
 websocket_loop = asyncio.new_event_loop()
 
+# Progress updates are coalesced per task: within this window only the latest
+# message of each task is broadcast.
+PROGRESS_COALESCE_INTERVAL = 0.1
+_pending_progress: dict[str, str] = {}
+_progress_flush_scheduled = False
+_pending_progress_lock = threading.Lock()
+
 
 def normalize_record_path(path_str: str) -> str:
     """Normalize stored record paths using the configured DB base path."""
@@ -103,17 +166,37 @@ def resolve_record_path(path_str: str) -> Path:
     return resolve_db_path(path_str, BASE_DIR)
 
 
-async def _send_progress(task_id, message):
-    data = json.dumps({"task_id": task_id, "message": message})
+def _send_progress(data: str) -> None:
+    # Runs on the websocket loop. ``websockets.broadcast`` writes to every open
+    # connection without awaiting per-client flow control; closed or slow
+    # clients are skipped instead of holding up the others.
     if connected_clients:
-        await asyncio.gather(
-            *[client.send(data) for client in list(connected_clients) if not client.closed]
-        )
+        websockets.broadcast(list(connected_clients), data)
+
+
+def _flush_progress() -> None:
+    """Broadcast the latest pending message of every task (on the websocket loop)."""
+    global _progress_flush_scheduled
+    with _pending_progress_lock:
+        pending = dict(_pending_progress)
+        _pending_progress.clear()
+        _progress_flush_scheduled = False
+    for task_id, message in pending.items():
+        _send_progress(json.dumps({"task_id": task_id, "message": message}))
 
 
 def broadcast_progress(task_id, message):
-    if websocket_loop.is_running():
-        asyncio.run_coroutine_threadsafe(_send_progress(task_id, message), websocket_loop)
+    global _progress_flush_scheduled
+    if not websocket_loop.is_running():
+        return
+    with _pending_progress_lock:
+        _pending_progress[task_id] = message
+        if _progress_flush_scheduled:
+            return
+        _progress_flush_scheduled = True
+    websocket_loop.call_soon_threadsafe(
+        websocket_loop.call_later, PROGRESS_COALESCE_INTERVAL, _flush_progress
+    )
 
 
 async def websocket_handler(websocket):
@@ -151,47 +234,46 @@ def register_process(task_id: str, process):
 def unregister_process(task_id: str):
     """Unregister a process when it completes."""
     with process_lock:
-        if task_id in running_processes:
-            del running_processes[task_id]
+        if running_processes.pop(task_id, None) is not None:
             print(f"Unregistered process for task {task_id}")
 
 def cancel_task(task_id: str):
     """Cancel a running task by terminating its process."""
     with process_lock:
-        if task_id in running_processes:
-            task_info = running_processes[task_id]
-            task_info['cancelled'] = True
-            process = task_info['process']
-            
-            try:
-                print(f"Terminating process for task {task_id}, PID: {process.pid}")
-                process.terminate()
-                
-                # Give it a moment to terminate gracefully
-                try:
-                    process.wait(timeout=5)
-                    print(f"Process {process.pid} terminated gracefully")
-                except subprocess.TimeoutExpired:
-                    print(f"Process {process.pid} didn't terminate gracefully, killing...")
-                    process.kill()
-                    process.wait()
-                    print(f"Process {process.pid} killed")
-                    
-            except Exception as e:
-                print(f"Error terminating process for task {task_id}: {e}")
-            
-            return True
-        else:
+        task_info = running_processes.get(task_id)
+        if task_info is None:
             print(f"Task {task_id} not found in running processes")
             return False
+        task_info['cancelled'] = True
+        process = task_info['process']
+
+    # Wait for the process outside the lock so other tasks can still be
+    # registered or cancelled meanwhile.
+    try:
+        print(f"Terminating process for task {task_id}, PID: {process.pid}")
+        process.terminate()
+        
+        # Give it a moment to terminate gracefully
+        try:
+            process.wait(timeout=5)
+            print(f"Process {process.pid} terminated gracefully")
+        except subprocess.TimeoutExpired:
+            print(f"Process {process.pid} didn't terminate gracefully, killing...")
+            process.kill()
+            process.wait()
+            print(f"Process {process.pid} killed")
+            
+    except Exception as e:
+        print(f"Error terminating process for task {task_id}: {e}")
+    
+    return True
 
 
 def is_task_cancelled(task_id: str):
     """Check if a task has been cancelled."""
     with process_lock:
-        if task_id in running_processes:
-            return running_processes[task_id]['cancelled']
-        return False
+        task_info = running_processes.get(task_id)
+        return task_info['cancelled'] if task_info else False
 
 
 def update_task_progress(task_id: str, message: str):
@@ -201,7 +283,7 @@ def update_task_progress(task_id: str, message: str):
             'message': message,
             'timestamp': time.time()
         }
-        print(f"Task {task_id}: {message}")
+    print(f"Task {task_id}: {message}")
     broadcast_progress(task_id, message)
 
 
@@ -214,18 +296,18 @@ def get_task_progress(task_id: str):
 def clear_task_progress(task_id: str):
     """Clear progress for a completed/cancelled task."""
     with progress_lock:
-        if task_id in task_progress:
-            del task_progress[task_id]
+        task_progress.pop(task_id, None)
 
 def get_running_tasks():
     """Get information about currently running tasks."""
+    now = time.time()
     with process_lock:
         return {
             task_id: {
                 'pid': info['process'].pid,
                 'start_time': info['start_time'],
                 'cancelled': info['cancelled'],
-                'duration': time.time() - info['start_time']
+                'duration': now - info['start_time']
             }
             for task_id, info in running_processes.items()
         }
@@ -252,24 +334,144 @@ def get_file_type(file_path: Path):
         return 'unknown'
 
 
-def get_audio_duration(file_path: Path):
+def _format_duration(duration: float) -> str:
+    minutes = int(duration // 60)
+    seconds = int(duration % 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def _ffprobe_duration(file_path: str):
     """Get audio file duration using ffprobe."""
     try:
         result = subprocess.run([
             'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', str(file_path)
+            '-of', 'csv=p=0', file_path
         ], capture_output=True, text=True, check=True)
-        duration = float(result.stdout.strip())
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_duration(float(result.stdout.strip()))
     except (subprocess.CalledProcessError, ValueError, FileNotFoundError):
         return None
 
 
-def compute_file_hash(data: bytes) -> str:
-    """Compute SHA256 hash for given file data."""
-    return hashlib.sha256(data).hexdigest()
+@functools.lru_cache(maxsize=256)
+def _probe_duration(file_path: str, mtime_ns: int, size: int):
+    """Read the duration from the file header, falling back to ffprobe.
+
+    ``mtime_ns``/``size`` are only part of the cache key so a replaced file
+    is probed again.
+    """
+    if MUTAGEN_AVAILABLE:
+        try:
+            media = MutagenFile(file_path)
+            if media is not None and media.info and media.info.length:
+                return _format_duration(media.info.length)
+        except Exception:
+            pass
+    return _ffprobe_duration(file_path)
+
+
+def get_audio_duration(file_path: Path):
+    """Get audio file duration as ``MM:SS`` (mutagen header parse, ffprobe fallback)."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return _probe_duration(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def stream_multipart_files(rfile, boundary: str, content_length: int) -> dict[str, list[dict]]:
+    """Stream the file parts of a multipart/form-data body to disk.
+
+    Each file part is written to a temporary file in ``UPLOAD_DIR`` while
+    its SHA256 is computed, so memory use is bounded by ``UPLOAD_CHUNK_SIZE``
+    instead of the upload size. Returns ``{field name: [{"filename",
+    "temp_path", "file_hash"}]}``; the caller moves or deletes the temp files.
+    """
+    delimiter = b"\r\n--" + boundary.encode()
+    keep = len(delimiter) - 1
+    remaining = content_length
+    files: dict[str, list[dict]] = {}
+
+    def read_more() -> bytes:
+        nonlocal remaining
+        if remaining <= 0:
+            return b""
+        chunk = rfile.read(min(UPLOAD_CHUNK_SIZE, remaining))
+        remaining -= len(chunk)
+        return chunk
+
+    # The first boundary is not preceded by CRLF; prepend one so every
+    # boundary matches ``delimiter``. Anything before it is preamble.
+    buffer = bytearray(b"\r\n")
+    while (pos := buffer.find(delimiter)) == -1:
+        chunk = read_more()
+        if not chunk:
+            return files
+        del buffer[:-keep]
+        buffer += chunk
+    del buffer[:pos + len(delimiter)]
+
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        while True:
+            # A delimiter is followed by "--" at the end of the body and by
+            # CRLF plus the part headers otherwise.
+            while len(buffer) < 2:
+                chunk = read_more()
+                if not chunk:
+                    return files
+                buffer += chunk
+            if buffer[:2] == b"--":
+                return files
+
+            while (header_end := buffer.find(b"\r\n\r\n")) == -1:
+                if len(buffer) > MULTIPART_HEADER_LIMIT:
+                    raise ValueError("Multipart part headers too large")
+                chunk = read_more()
+                if not chunk:
+                    raise ValueError("Truncated multipart body")
+                buffer += chunk
+            headers = bytes(buffer[:header_end]).decode("utf-8", "replace")
+            del buffer[:header_end + 4]
+
+            filename_match = re.search(r'filename="([^"]*)"', headers)
+            name_match = re.search(r'name="([^"]*)"', headers)
+            sink = None
+            digest = None
+            if filename_match and name_match:
+                sink = tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, prefix=".upload-", delete=False)
+                digest = hashlib.sha256()
+                entry = {"filename": filename_match.group(1), "temp_path": Path(sink.name)}
+                files.setdefault(name_match.group(1), []).append(entry)
+
+            # Copy the part body up to the next delimiter, holding back enough
+            # bytes to recognise a delimiter split across two reads.
+            try:
+                while True:
+                    pos = buffer.find(delimiter)
+                    end = pos if pos != -1 else max(len(buffer) - keep, 0)
+                    if sink is not None and end:
+                        body = memoryview(buffer)[:end]
+                        sink.write(body)
+                        digest.update(body)
+                        body.release()
+                    if pos != -1:
+                        del buffer[:pos + len(delimiter)]
+                        break
+                    del buffer[:end]
+                    chunk = read_more()
+                    if not chunk:
+                        raise ValueError("Truncated multipart body")
+                    buffer += chunk
+            finally:
+                if sink is not None:
+                    sink.close()
+            if digest is not None:
+                entry["file_hash"] = digest.hexdigest()
+    except BaseException:
+        for entries in files.values():
+            for entry in entries:
+                entry["temp_path"].unlink(missing_ok=True)
+        raise
 
 
 def _ensure_record_schema(record: dict) -> bool:
@@ -307,42 +509,160 @@ def _ensure_record_schema(record: dict) -> bool:
     return updated
 
 
+# Keys every record gains from ``_ensure_record_schema``. Loads only check for
+# their presence; full normalization runs in ``migrate_store_schemas``.
+_CRITICAL_RECORD_KEYS = (
+    "completed_tasks",
+    "download_links",
+    "deleted",
+    "deleted_at",
+    "deleted_assets",
+)
+
+
+def _record_needs_migration(record) -> bool:
+    return not all(key in record for key in _CRITICAL_RECORD_KEYS)
+
+
+def _ensure_history_schema(history: list) -> bool:
+    """Normalize every history record; return True if any was changed."""
+    updated = False
+    for record in history:
+        if _ensure_record_schema(record):
+            updated = True
+    return updated
+
+
+def _ensure_registry_schema(registry: dict) -> bool:
+    """Normalize the deletion flags of every registry entry."""
+    updated = False
+    for info in registry.values():
+        if not isinstance(info, dict):
+            continue
+        if not isinstance(info.get("deleted"), bool):
+            info["deleted"] = False
+            updated = True
+        if "deleted_at" not in info:
+            info["deleted_at"] = None
+            updated = True
+    return updated
+
+
+def migrate_store_schemas():
+    """Bring the upload history and file registry up to the current schema.
+
+    Runs once at startup and writes each store back only if something
+    changed, so regular loads can skip the per-record normalization.
+    """
+    try:
+        history = read_json(HISTORY_FILE)
+    except (json.JSONDecodeError, IOError):
+        history = None
+    if isinstance(history, list) and _ensure_history_schema(history):
+        save_upload_history(history)
+
+    try:
+        registry = read_json(FILE_REGISTRY_FILE)
+    except (json.JSONDecodeError, IOError):
+        registry = None
+    if isinstance(registry, dict) and _ensure_registry_schema(registry):
+        save_file_registry(registry, durable=True)
+
+
+class HistoryView(list):
+    """Upload history list that also keeps an ``id`` → record lookup.
+
+    ``by_id`` holds references to the same dicts stored in the list, so
+    in-place edits through either view are saved together.
+    """
+
+    def __init__(self, records=()):
+        super().__init__(records)
+        # Iterate in reverse so the first record wins for duplicate ids,
+        # matching the previous linear scans.
+        self.by_id = {
+            record.get("id"): record
+            for record in reversed(self)
+            if isinstance(record, dict)
+        }
+
+    def insert(self, index, record):
+        super().insert(index, record)
+        self.by_id[record.get("id")] = record
+
+    def append(self, record):
+        super().append(record)
+        self.by_id.setdefault(record.get("id"), record)
+
+
 def load_upload_history():
-    """Load upload history from JSON file and normalize record schema."""
+    """Load upload history from JSON file.
+
+    Records are normalized by :func:`migrate_store_schemas` at startup; here
+    the schema is only re-applied if a record is missing one of its keys.
+    """
     if HISTORY_FILE.exists():
         try:
-            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                history = json.load(f)
+            history = read_json(HISTORY_FILE)
 
             if not isinstance(history, list):
-                return []
+                return HistoryView()
 
             updated = False
-            for record in history:
-                if _ensure_record_schema(record):
-                    updated = True
+            if any(_record_needs_migration(record) for record in history):
+                updated = _ensure_history_schema(history)
 
+            history = HistoryView(history)
             if updated:
                 save_upload_history(history)
 
             return history
         except (json.JSONDecodeError, IOError):
-            return []
-    return []
+            return HistoryView()
+    return HistoryView()
+
+
+def _history_snapshot() -> HistoryView:
+    """Return the upload history parsed once per ``(mtime_ns, size)`` of the file.
+
+    Only for read-only callers: the returned records are shared between
+    calls and must not be mutated. Use :func:`load_upload_history` to edit.
+    """
+    try:
+        st = HISTORY_FILE.stat()
+    except OSError:
+        return HistoryView()
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _HISTORY_CACHE.get(HISTORY_FILE)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    history = load_upload_history()
+    try:
+        st = HISTORY_FILE.stat()
+    except OSError:
+        return history
+    # Loading may have rewritten the file to normalize old records.
+    _HISTORY_CACHE[HISTORY_FILE] = ((st.st_mtime_ns, st.st_size), history)
+    return history
 
 
 def get_active_history(history: list[dict] | None = None) -> list[dict]:
-    """Return history entries that are not marked as deleted."""
+    """Return history entries that are not marked as deleted.
+
+    Without ``history`` the shared snapshot is used, so the returned records
+    must be treated as read-only.
+    """
     if history is None:
-        history = load_upload_history()
+        history = _history_snapshot()
     return [record for record in history if not record.get("deleted")]
 
 
 def save_upload_history(history):
     """Save upload history to JSON file."""
+    _HISTORY_CACHE.pop(HISTORY_FILE, None)
     try:
-        with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        write_json(HISTORY_FILE, history)
     except IOError:
         pass
 
@@ -358,7 +678,7 @@ def add_upload_record(file_path: Path, file_type: str, duration: str = None, fil
         "duration": duration,
         "file_path": to_record_path(file_path),
         "folder_name": file_path.parent.name,  # UUID folder name
-        "completed_tasks": {task: False for task in TASK_TYPES},
+        "completed_tasks": _EMPTY_TASKS.copy(),
         "download_links": {},
         "title_summary": "",
         "tags": [],
@@ -374,58 +694,189 @@ def add_upload_record(file_path: Path, file_type: str, duration: str = None, fil
 
     # Keep only last 100 records
     if len(history) > 100:
-        history = history[:100]
+        history = HistoryView(history[:100])
 
     save_upload_history(history)
     return record
 
+def _copy_registry(registry: dict) -> dict:
+    """Copy the registry and its per-file dicts so callers can mutate freely."""
+    return {
+        file_uuid: dict(info) if isinstance(info, dict) else info
+        for file_uuid, info in registry.items()
+    }
+
+
+def _cache_file_registry(registry: dict) -> None:
+    """Remember ``registry`` as the parsed content of the file on disk."""
+    try:
+        st = FILE_REGISTRY_FILE.stat()
+    except OSError:
+        _REGISTRY_CACHE.pop(FILE_REGISTRY_FILE, None)
+        return
+    _REGISTRY_CACHE[FILE_REGISTRY_FILE] = _RegistryCache(
+        (st.st_mtime_ns, st.st_size),
+        _copy_registry(registry),
+    )
+
+
+def _current_registry_cache() -> _RegistryCache | None:
+    """Return the registry cache if it still matches the file on disk."""
+    cached = _REGISTRY_CACHE.get(FILE_REGISTRY_FILE)
+    if cached is None:
+        return None
+    try:
+        st = FILE_REGISTRY_FILE.stat()
+    except OSError:
+        return None
+    if cached.signature != (st.st_mtime_ns, st.st_size):
+        return None
+    return cached
+
+
+def _compute_entry_paths(file_path: str) -> tuple[str, Path | None]:
+    normalized = normalize_record_path(file_path)
+    return normalized, resolve_record_path(normalized) if normalized else None
+
+
+def _registry_entry_paths() -> dict[str, tuple[str, str, Path | None]]:
+    """Return ``{uuid: (file_path, normalized, resolved)}`` for the cached registry.
+
+    Paths are normalized once per cached registry instead of once per lookup;
+    an empty mapping is returned when the cache is stale.
+    """
+    cached = _current_registry_cache()
+    if cached is None:
+        return {}
+    return _ensure_entry_paths(cached)
+
+
+def _ensure_entry_paths(cached: _RegistryCache) -> dict[str, tuple[str, str, Path | None]]:
+    if cached.entry_paths is None:
+        entry_paths = {}
+        for uuid_key, info in cached.registry.items():
+            if isinstance(info, dict):
+                file_path = info.get("file_path", "")
+                entry_paths[uuid_key] = (file_path, *_compute_entry_paths(file_path))
+        cached.entry_paths = entry_paths
+    return cached.entry_paths
+
+
+def _stored_paths(
+    file_uuid: str,
+    info: dict,
+    entry_paths: dict[str, tuple[str, str, Path | None]],
+) -> tuple[str, Path | None]:
+    """Return ``(normalized, resolved)`` for a registry entry.
+
+    Uses the precomputed paths from :func:`_registry_entry_paths` unless the
+    caller's copy of the entry points somewhere else.
+    """
+    file_path = info.get("file_path", "")
+    cached = entry_paths.get(file_uuid)
+    if cached is not None and cached[0] == file_path:
+        return cached[1], cached[2]
+    return _compute_entry_paths(file_path)
+
+
+def _registry_path_index() -> tuple[dict[str, str], int] | None:
+    """Return ``({resolved path: uuid}, entry count)`` for the registry on disk.
+
+    The index is built lazily from the cached registry and dropped with it,
+    so ``None`` is returned when the cache does not match the file.
+    """
+    cached = _current_registry_cache()
+    if cached is None:
+        return None
+    if cached.path_index is None:
+        path_index = {}
+        for uuid_key, (_, _, resolved) in _ensure_entry_paths(cached).items():
+            if resolved is not None:
+                path_index.setdefault(str(resolved), uuid_key)
+        cached.path_index = path_index
+    return cached.path_index, len(cached.registry)
+
+
 def load_file_registry():
-    """Load file registry from JSON file."""
-    if FILE_REGISTRY_FILE.exists():
-        try:
-            with open(FILE_REGISTRY_FILE, 'r', encoding='utf-8') as f:
-                registry = json.load(f)
-
-            if isinstance(registry, dict):
-                updated = False
-                for info in registry.values():
-                    if not isinstance(info, dict):
-                        continue
-                    if not isinstance(info.get("deleted"), bool):
-                        info["deleted"] = False
-                        updated = True
-                    if "deleted_at" not in info:
-                        info["deleted_at"] = None
-                        updated = True
-                if updated:
-                    save_file_registry(registry)
-                return registry
-        except (json.JSONDecodeError, IOError):
-            return {}
+    """Load file registry from JSON file.
+
+    The parsed registry is cached per ``(mtime_ns, size)`` of the file, so
+    repeated loads only re-read it after it changes on disk.
+    """
+    try:
+        st = FILE_REGISTRY_FILE.stat()
+    except OSError:
+        return {}
+    cached = _REGISTRY_CACHE.get(FILE_REGISTRY_FILE)
+    if cached is not None and cached.signature == (st.st_mtime_ns, st.st_size):
+        return _copy_registry(cached.registry)
+
+    try:
+        registry = read_json(FILE_REGISTRY_FILE)
+
+        if isinstance(registry, dict):
+            updated = False
+            if any(
+                isinstance(info, dict) and ("deleted" not in info or "deleted_at" not in info)
+                for info in registry.values()
+            ):
+                updated = _ensure_registry_schema(registry)
+            if updated:
+                save_file_registry(registry)
+            else:
+                _cache_file_registry(registry)
+            return registry
+    except (json.JSONDecodeError, IOError):
+        return {}
     return {}
 
-def save_file_registry(registry):
-    """Save file registry to JSON file."""
+def _registry_snapshot() -> dict:
+    """Return the cached registry itself instead of a copy.
+
+    Only for read-only callers: the returned dict is shared with the cache
+    and must not be mutated. Use :func:`load_file_registry` before editing.
+    """
+    cached = _current_registry_cache()
+    if cached is None:
+        registry = load_file_registry()
+        cached = _current_registry_cache()
+        if cached is None:
+            return registry
+    return cached.registry
+
+def save_file_registry(registry, durable: bool = False):
+    """Save file registry to JSON file.
+
+    The file is always replaced atomically; pass ``durable=True`` at
+    checkpoints that should also fsync it (e.g. the end of a migration).
+    """
     try:
-        with open(FILE_REGISTRY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(registry, f, ensure_ascii=False, indent=2)
+        write_json(FILE_REGISTRY_FILE, registry, durable=durable)
     except IOError:
-        pass
+        _REGISTRY_CACHE.pop(FILE_REGISTRY_FILE, None)
+        return
+    _cache_file_registry(registry)
+
+
+# Hyphenated or plain 32-digit hex, optionally wrapped in braces -- the forms
+# ``uuid.UUID`` accepts in practice, matched without raising on paths.
+_UUID_RE = re.compile(
+    r"\A\{?[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\}?\Z"
+)
 
 
 def is_valid_uuid(value: str) -> bool:
     """Check whether a string is a valid UUID value."""
-    if not value:
-        return False
-    try:
-        uuid.UUID(str(value))
-        return True
-    except (ValueError, TypeError):
-        return False
+    return bool(value) and isinstance(value, str) and _UUID_RE.match(value) is not None
+
 
+def resolve_file_identifier(file_identifier: str, registry: dict | None = None):
+    """Resolve a file identifier (UUID or path) to an absolute path and metadata.
 
-def resolve_file_identifier(file_identifier: str):
-    """Resolve a file identifier (UUID or path) to an absolute path and metadata."""
+    Callers that already hold the file registry (e.g. batch resets) pass it
+    as ``registry`` so it is not reloaded for every identifier.
+    """
     if not file_identifier:
         return None, None, None, None
 
@@ -435,7 +886,8 @@ def resolve_file_identifier(file_identifier: str):
 
     identifier = identifier.lstrip("/").replace('\\', '/')
 
-    registry = load_file_registry()
+    if registry is None:
+        registry = load_file_registry()
 
     if is_valid_uuid(identifier):
         file_info = registry.get(identifier)
@@ -461,19 +913,42 @@ def resolve_file_identifier(file_identifier: str):
     task_type = None
     resolved_identifier = identifier
 
-    for uuid_key, info in registry.items():
-        stored_path = normalize_record_path(info.get("file_path", ""))
-        if resolve_record_path(stored_path) == full_path:
-            record_id = info.get("record_id")
-            task_type = info.get("task_type")
-            resolved_identifier = uuid_key
-            break
+    entry_paths = _registry_entry_paths()
+
+    def matches(uuid_key, info) -> bool:
+        return _stored_paths(uuid_key, info, entry_paths)[1] == full_path
+
+    match = None
+    scan = True
+    indexed = _registry_path_index()
+    if indexed is not None:
+        path_index, indexed_count = indexed
+        uuid_key = path_index.get(str(full_path))
+        info = registry.get(uuid_key) if uuid_key is not None else None
+        if isinstance(info, dict) and matches(uuid_key, info):
+            match = (uuid_key, info)
+            scan = False
+        elif uuid_key is None and len(registry) == indexed_count:
+            # The caller's registry mirrors the file and the path is not in it.
+            scan = False
+    if scan:
+        # The caller's registry diverged from the file on disk; scan it.
+        match = next(
+            ((uuid_key, info) for uuid_key, info in registry.items() if matches(uuid_key, info)),
+            None,
+        )
+
+    if match is not None:
+        resolved_identifier, info = match
+        record_id = info.get("record_id")
+        task_type = info.get("task_type")
 
     return full_path, record_id, task_type, resolved_identifier
 
 
+@functools.lru_cache(maxsize=4096)
 def _timestamp_to_sort_key(timestamp_str: str) -> float:
-    """Convert ISO timestamp string to numeric sort key."""
+    """Convert ISO timestamp string to numeric sort key (memoized)."""
     if not timestamp_str:
         return float('-inf')
     try:
@@ -486,19 +961,17 @@ def _collect_searchable_documents():
     """Return documents eligible for keyword search and similarity mapping."""
     documents = []
     path_index = {}
-    registry = load_file_registry()
+    registry = _registry_snapshot()
+    entry_paths = _registry_entry_paths()
 
     for file_uuid, info in registry.items():
         if isinstance(info, dict) and info.get("deleted"):
             continue
-        rel_path = normalize_record_path(info.get("file_path"))
+        rel_path, full_path = _stored_paths(file_uuid, info, entry_paths)
         if not rel_path:
             continue
 
-        full_path = resolve_record_path(rel_path)
-        if not full_path.exists():
-            continue
-
+        # Existence is not stat'ed here; readers skip files that are gone.
         if full_path.suffix.lower() not in SEARCHABLE_SUFFIXES:
             continue
 
@@ -507,6 +980,7 @@ def _collect_searchable_documents():
             "info": info,
             "full_path": full_path,
             "relative_path": rel_path,
+            "file_name": Path(rel_path).name,
         }
 
         documents.append(doc)
@@ -515,44 +989,113 @@ def _collect_searchable_documents():
     return documents, path_index
 
 
+KEYWORD_SEARCH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Shared by every keyword search so a query does not spin up its own threads.
+_keyword_search_executor = ThreadPoolExecutor(
+    max_workers=KEYWORD_SEARCH_MAX_WORKERS, thread_name_prefix="keyword-search"
+)
+
+
 def _collect_keyword_matches(query: str, documents, history_map, limit: int = 5):
     """Return top keyword matches sorted by frequency and recency."""
     if not query:
         return []
 
-    pattern = re.compile(re.escape(query), re.IGNORECASE)
-    matches = []
+    # Plain substring counting avoids building a list of match strings. A
+    # query without cased characters is matched exactly; an ASCII query is
+    # compared against the lowered text. Other queries keep the regex path so
+    # Unicode case-insensitive matching behaves as before.
+    #
+    # Stored documents are normally UTF-8, so for the first two kinds a UTF-8
+    # file is counted directly on the raw bytes without decoding. Files in
+    # another encoding (e.g. cp949 uploads) are decoded first, since their
+    # trailing bytes can look like ASCII letters.
+    byte_needle = None
+    fold_bytes = False
+    if query.lower() == query.upper():
+        byte_needle = query.encode("utf-8")
+
+        def count_matches(text: str) -> int:
+            return text.count(query)
+    elif query.isascii():
+        lowered_query = query.lower()
+        byte_needle = lowered_query.encode("ascii")
+        fold_bytes = True
+
+        def count_matches(text: str) -> int:
+            return text.lower().count(lowered_query)
+    else:
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
 
-    for doc in documents:
-        try:
-            text = read_text_with_fallback(doc["full_path"])
-        except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"키워드 검색을 위한 파일 읽기 실패 {doc['full_path']}: {exc}")
-            continue
+        def count_matches(text: str) -> int:
+            return sum(1 for _ in pattern.finditer(text))
 
-        count = len(pattern.findall(text))
-        if count <= 0:
-            continue
+    def is_utf8(raw: bytes) -> bool:
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+        return True
 
-        record = history_map.get(doc["info"].get("record_id"), {})
-        timestamp = record.get("timestamp")
+    def score(doc) -> int:
+        # A missing file simply has no matches.
+        try:
+            raw = doc["full_path"].read_bytes()
+        except FileNotFoundError:
+            return 0
+        except OSError as exc:  # pragma: no cover - defensive logging
+            print(f"키워드 검색을 위한 파일 읽기 실패 {doc['full_path']}: {exc}")
+            return 0
+        if byte_needle is not None and (raw.isascii() or is_utf8(raw)):
+            return (raw.lower() if fold_bytes else raw).count(byte_needle)
+        text = decode_text_with_fallback(raw)
+        if text is None:
+            print(f"키워드 검색을 위한 파일 디코딩 실패 {doc['full_path']}")
+            return 0
+        return count_matches(text)
+
+    # Overlap file reads with counting on other documents.
+    if len(documents) > 1:
+        counts = list(_keyword_search_executor.map(score, documents))
+    else:
+        counts = [score(doc) for doc in documents]
+
+    def sort_key(item) -> tuple[int, float]:
+        doc, count = item
+        record = history_map.get(doc["info"].get("record_id")) or {}
+        return -count, -_timestamp_to_sort_key(record.get("timestamp"))
+
+    # Rank (doc, count) pairs first and only build response rows for the top
+    # ``limit``; the key is evaluated once per matching document.
+    ranked = heapq.nsmallest(
+        limit,
+        ((doc, count) for doc, count in zip(documents, counts) if count > 0),
+        key=sort_key,
+    )
 
+    matches = []
+    for doc, count in ranked:
+        record = history_map.get(doc["info"].get("record_id")) or {}
         matches.append({
             "file_uuid": doc["uuid"],
             "file": doc["relative_path"],
-            "display_name": doc["info"].get("original_filename") or Path(doc["relative_path"]).name,
+            "display_name": doc["info"].get("original_filename") or doc["file_name"],
             "count": count,
-            "uploaded_at": timestamp,
+            "uploaded_at": record.get("timestamp"),
             "source_filename": record.get("filename"),
             "link": f"/download/{doc['uuid']}",
         })
 
-    matches.sort(key=lambda item: (-item["count"], -_timestamp_to_sort_key(item.get("uploaded_at"))))
-    return matches[:limit]
+    return matches
 
-def register_file(file_path: str, record_id: str, task_type: str, original_filename: str = None):
-    """Register a file with UUID and return the file UUID."""
-    registry = load_file_registry()
+def _register_file_in_memory(
+    registry: dict,
+    file_path: str,
+    record_id: str,
+    task_type: str,
+    original_filename: str = None,
+) -> str:
+    """Add a file entry to ``registry`` without saving it and return its UUID."""
     file_uuid = str(uuid.uuid4())
 
     normalized_path = normalize_record_path(file_path)
@@ -569,18 +1112,31 @@ def register_file(file_path: str, record_id: str, task_type: str, original_filen
     }
     
     registry[file_uuid] = file_info
+    return file_uuid
+
+def register_file(file_path: str, record_id: str, task_type: str, original_filename: str = None):
+    """Register a file with UUID and return the file UUID."""
+    registry = load_file_registry()
+    file_uuid = _register_file_in_memory(registry, file_path, record_id, task_type, original_filename)
     save_file_registry(registry)
     return file_uuid
 
 def get_file_by_uuid(file_uuid: str):
     """Get file info by UUID."""
-    registry = load_file_registry()
-    return registry.get(file_uuid)
+    info = _registry_snapshot().get(file_uuid)
+    return dict(info) if isinstance(info, dict) else info
 
 def migrate_existing_files():
     """Migrate existing files from upload history to file registry."""
     history = load_upload_history()
     registry = load_file_registry()
+    entry_paths = _registry_entry_paths()
+    # Legacy entries without a record_id can never match a history record.
+    registered = {
+        (_stored_paths(file_uuid, file_info, entry_paths)[0], file_info["record_id"])
+        for file_uuid, file_info in registry.items()
+        if file_info.get("record_id")
+    }
     updated = False
     
     for record in history:
@@ -595,22 +1151,20 @@ def migrate_existing_files():
                 file_path = normalize_record_path(download_url[10:])  # Remove "/download/" prefix
 
                 # Check if this file is already registered
-                already_registered = False
-                for file_info in registry.values():
-                    if normalize_record_path(file_info["file_path"]) == file_path and file_info["record_id"] == record_id:
-                        already_registered = True
-                        break
-
-                if not already_registered:
+                if (file_path, record_id) not in registered:
                     # Register the file and update download link
                     full_path = resolve_record_path(file_path)
                     if full_path.exists():
-                        file_uuid = register_file(file_path, record_id, task_type, os.path.basename(full_path))
+                        file_uuid = _register_file_in_memory(
+                            registry, file_path, record_id, task_type, os.path.basename(full_path)
+                        )
+                        registered.add((file_path, record_id))
                         # Update the download link to use UUID
                         record["download_links"][task_type] = f"/download/{file_uuid}"
                         updated = True
     
     if updated:
+        save_file_registry(registry, durable=True)
         save_upload_history(history)
         print("기존 파일들이 레지스트리에 등록되었습니다.")
 
@@ -622,13 +1176,12 @@ def update_task_completion(record_id: str, task: str, file_path: str):
     file_uuid = register_file(file_path, record_id, task)
     download_url = f"/download/{file_uuid}"
     
-    for record in history:
-        if record["id"] == record_id:
-            if record.get("deleted"):
-                return file_uuid
-            record["completed_tasks"][task] = True
-            record["download_links"][task] = download_url
-            break
+    record = history.by_id.get(record_id)
+    if record:
+        if record.get("deleted"):
+            return file_uuid
+        record["completed_tasks"][task] = True
+        record["download_links"][task] = download_url
     
     save_upload_history(history)
     return file_uuid
@@ -636,23 +1189,21 @@ def update_task_completion(record_id: str, task: str, file_path: str):
 def update_title_summary(record_id: str, summary: str):
     """Store one-line summary for a record."""
     history = load_upload_history()
-    for record in history:
-        if record["id"] == record_id:
-            if record.get("deleted"):
-                return
-            record["title_summary"] = summary
-            break
+    record = history.by_id.get(record_id)
+    if record:
+        if record.get("deleted"):
+            return
+        record["title_summary"] = summary
     save_upload_history(history)
 
 def update_filename(record_id: str, new_filename: str):
     """Update filename for a record."""
     history = load_upload_history()
-    for record in history:
-        if record["id"] == record_id:
-            if record.get("deleted"):
-                return
-            record["filename"] = new_filename
-            break
+    record = history.by_id.get(record_id)
+    if record:
+        if record.get("deleted"):
+            return
+        record["filename"] = new_filename
     save_upload_history(history)
 
 def generate_and_store_title_summary(record_id: str, file_path: Path, model: str = None):
@@ -686,6 +1237,77 @@ def find_existing_stt_file(original_file_path: Path):
     print(f"[DEBUG] '{stem}.md' STT 파일을 찾지 못함 (경로: {stt_output_dir})")
     return None
 
+def _iter_stt_md(root: Path) -> Iterator[Path]:
+    """Yield STT result ``.md`` files under ``root``, skipping summaries.
+
+    Walks with ``os.scandir`` so names and entry types come from the
+    directory listing instead of a ``Path`` and ``stat`` per file.
+    ``deleted`` folders and directory symlinks are not descended into, as
+    with the previous ``rglob`` walk.
+    """
+    try:
+        with os.scandir(root) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name != "deleted":
+                    yield from _iter_stt_md(Path(entry.path))
+            elif name.endswith(".md") and not name.endswith(".summary.md") and entry.is_file():
+                yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _embed_pending_batch(items: list, model_name: str) -> list:
+    """Read, embed and save vectors for one batch of changed files.
+
+    Returns ``(md_file, key, st, checksum, vector_file)`` for every file whose
+    vector was written; failures are reported and skipped.
+    """
+    batch = []
+    for md_file, key, st, checksum in items:
+        try:
+            text = md_file.read_text(encoding="utf-8")
+        except Exception as e:
+            print(f"임베딩 생성 실패 {md_file.name}: {e}")
+            continue
+        if not text.strip():
+            print(f"임베딩 생성 실패 {md_file.name}: 임베딩할 텍스트가 비어 있습니다.")
+            continue
+        batch.append((md_file, key, st, checksum, text))
+
+    try:
+        vectors = embed_texts_ollama([item[4] for item in batch], model_name)
+    except Exception as e:
+        # Retry one by one so a single bad file does not sink the batch
+        print(f"일괄 임베딩 실패, 파일별로 재시도: {e}")
+        vectors = []
+        for md_file, _, _, _, text in batch:
+            try:
+                vectors.append(embed_text_ollama(text, model_name))
+            except Exception as exc:
+                print(f"임베딩 생성 실패 {md_file.name}: {exc}")
+                vectors.append(None)
+
+    results = []
+    for (md_file, key, st, checksum, _), vector in zip(batch, vectors):
+        if vector is None:
+            continue
+        try:
+            # Save embedding vector with unique name
+            vector_file = VECTOR_DIR / f"{md_file.parent.name}_{md_file.stem}.npy"
+            np.save(vector_file, vector)
+        except Exception as e:
+            print(f"임베딩 생성 실패 {md_file.name}: {e}")
+            continue
+        results.append((md_file, key, st, checksum, vector_file))
+    return results
+
+
 def run_incremental_embedding(base_dir: Path = None):
     """Run incremental embedding on all existing STT result files."""
     if base_dir is None:
@@ -703,50 +1325,67 @@ def run_incremental_embedding(base_dir: Path = None):
         index = load_index()
         processed_count = 0
         
-        # Find all STT result files
-        for md_file in base_dir.glob("**/*.md"):
-            # Skip summary files
-            if md_file.name.endswith('.summary.md'):
+        # Find all STT result files (summary files are skipped)
+        md_files = list(_iter_stt_md(base_dir))
+
+        # Files whose mtime and size match the index entry are unchanged;
+        # only the others are hashed.
+        candidates = []
+        for md_file in md_files:
+            try:
+                st = md_file.stat()
+            except OSError:
                 continue
-                
+            key = index_key_for_path(md_file)
+            if entry_matches_stat(index.get(key), st):
+                continue
+            candidates.append((md_file, key, st))
+        checksums = file_hashes([md_file for md_file, _, _ in candidates])
+
+        pending = []
+        touched = []
+        for md_file, key, st in candidates:
             # Check if already processed and up-to-date
-            checksum = file_hash(md_file)
-            key = str(md_file.resolve())
-            if index.get(key, {}).get("sha256") == checksum:
-                continue  # Already up-to-date
-            
-            try:
-                # Read text content
-                text = md_file.read_text(encoding="utf-8")
-                
-                # Generate embedding
-                vector = embed_text_ollama(text, model_name)
-                
-                # Create vector directory if not exists
-                VECTOR_DIR.mkdir(parents=True, exist_ok=True)
-                
-                # Save embedding vector with unique name
-                vector_file = VECTOR_DIR / f"{md_file.parent.name}_{md_file.stem}.npy"
-                np.save(vector_file, vector)
-                
-                # Update index
-                index[key] = {
-                    "sha256": checksum,
-                    "vector": vector_file.name,
-                    "deleted": False,
-                    "deleted_path": None,
-                    "vector_deleted_path": None,
-                }
-                
-                processed_count += 1
-                print(f"임베딩 생성 완료: {md_file.name}")
-                
-            except Exception as e:
-                print(f"임베딩 생성 실패 {md_file.name}: {e}")
+            checksum = checksums[md_file]
+            meta = index.get(key)
+            if meta and meta.get("sha256") == checksum:
+                # Content unchanged (e.g. only touched); remember the new stat
+                index[key] = {**meta, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+                touched.append((key, index[key]))
                 continue
+            pending.append((md_file, key, st, checksum))
+        save_index_entries(touched)
+
+        if pending:
+            # Create vector directory if not exists
+            VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Embed changed files in batches so each batch costs one request
+        # instead of one request per file. Batches run concurrently; the
+        # index is only updated here, on the calling thread.
+        batches = [
+            pending[start:start + EMBEDDING_BATCH_SIZE]
+            for start in range(0, len(pending), EMBEDDING_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=EMBEDDING_MAX_WORKERS) as executor:
+            for results in executor.map(lambda batch: _embed_pending_batch(batch, model_name), batches):
+                # Journal the whole batch with one append
+                embedded = []
+                for md_file, key, st, checksum, vector_file in results:
+                    index[key] = {
+                        "sha256": checksum,
+                        "vector": vector_file.name,
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "deleted": False,
+                        "deleted_path": None,
+                        "vector_deleted_path": None,
+                    }
+                    embedded.append((key, index[key]))
+                    processed_count += 1
+                    print(f"임베딩 생성 완료: {md_file.name}")
+                save_index_entries(embedded)
         
-        # Save updated index
-        save_index(index)
         print(f"증분 임베딩 완료: {processed_count}개 파일 처리됨")
         return processed_count
         
@@ -754,15 +1393,6 @@ def run_incremental_embedding(base_dir: Path = None):
         print(f"증분 임베딩 실행 실패: {e}")
         return 0
 
-def file_hash(path: Path) -> str:
-    """Return a stable SHA256 checksum for the given file."""
-    import hashlib
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
 def generate_embedding(file_path: Path, record_id: str = None):
     """Generate embedding for a text file and store it."""
     try:
@@ -773,6 +1403,9 @@ def generate_embedding(file_path: Path, record_id: str = None):
         except:
             model_name = os.environ.get("EMBEDDING_MODEL", "bge-m3:latest")
         
+        # Stat before reading so a later change is never mistaken for this version
+        st = file_path.stat()
+
         # Read text content
         text = file_path.read_text(encoding="utf-8")
         
@@ -786,18 +1419,18 @@ def generate_embedding(file_path: Path, record_id: str = None):
         vector_file = VECTOR_DIR / f"{file_path.stem}.npy"
         np.save(vector_file, vector)
         
-        # Update index
-        index = load_index()
+        # Update index (journaled; no full index rewrite)
         checksum = file_hash(file_path)
         
-        index[str(file_path.resolve())] = {
+        save_index_entry(index_key_for_path(file_path), {
             "sha256": checksum,
             "vector": vector_file.name,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
             "deleted": False,
             "deleted_path": None,
             "vector_deleted_path": None,
-        }
-        save_index(index)
+        })
         
         # Update task completion
         if record_id:
@@ -811,62 +1444,146 @@ def generate_embedding(file_path: Path, record_id: str = None):
         print(f"Embedding generation failed for {file_path.name}: {e}")
         return False
 
+def _index_entries_under(index: dict, output_dir: Path) -> list[tuple[str, dict, str]]:
+    """Return ``(key, meta, relative_path)`` for index entries inside ``output_dir``.
+
+    Index keys are already canonical (relative to ``whisper_output``), so a
+    string-prefix test replaces resolving every key. Only absolute keys, which
+    may come from older journals, fall back to ``Path.resolve``.
+    """
+    prefix = index_key_for_path(output_dir) + os.sep
+    output_resolved = None
+    entries = []
+    for key, meta in index.items():
+        if not isinstance(meta, dict):
+            continue
+        if key.startswith(prefix):
+            if meta.get("base", "whisper_output") == "whisper_output":
+                entries.append((key, meta, key[len(prefix):]))
+            continue
+        if not os.path.isabs(key):
+            continue
+        if output_resolved is None:
+            output_resolved = output_dir.resolve()
+        rel = relative_path_or_none(Path(key).resolve(), output_resolved)
+        if rel is None:
+            continue
+        entries.append((key, meta, str(rel)))
+    return entries
+
+
+def _group_index_by_folder(index: dict) -> dict[str, list[tuple[str, dict, str]]]:
+    """Group index entries under ``whisper_output`` by record folder name.
+
+    Values have the same ``(key, meta, relative_path)`` shape as
+    :func:`_index_entries_under`, so batch callers can look up a record's
+    entries without rescanning the whole index.
+    """
+    groups: dict[str, list[tuple[str, dict, str]]] = defaultdict(list)
+    output_resolved = None
+    for key, meta in index.items():
+        if not isinstance(meta, dict):
+            continue
+        if os.path.isabs(key):
+            if output_resolved is None:
+                output_resolved = OUTPUT_DIR.resolve()
+            relative = relative_path_or_none(Path(key).resolve(), output_resolved)
+            if relative is None:
+                continue
+            canonical = str(relative)
+        elif meta.get("base", "whisper_output") == "whisper_output":
+            canonical = key
+        else:
+            continue
+        folder, sep, rel = canonical.partition(os.sep)
+        if sep:
+            groups[folder].append((key, meta, rel))
+    return groups
+
+
+def _group_registry_by_record(registry: dict) -> dict[str, list[tuple[str, dict]]]:
+    """Group registry entries by the record they belong to."""
+    groups: dict[str, list[tuple[str, dict]]] = defaultdict(list)
+    for file_uuid, info in registry.items():
+        if isinstance(info, dict):
+            groups[info.get("record_id")].append((file_uuid, info))
+    return groups
+
+
+def _vector_refcounts(index: dict) -> Counter:
+    """Count how many index entries reference each vector file."""
+    return Counter(
+        meta["vector"]
+        for meta in index.values()
+        if isinstance(meta, dict) and meta.get("vector")
+    )
+
+
+def _release_vector(vector_name: str | None, vector_refs: Counter) -> None:
+    """Drop one reference to a vector file and unlink it once unreferenced."""
+    if not vector_name:
+        return
+    vector_refs[vector_name] -= 1
+    if vector_refs[vector_name] > 0:
+        return
+    vector_path = VECTOR_DIR / vector_name
+    if vector_path.exists():
+        try:
+            vector_path.unlink()
+        except Exception:
+            pass
+
+
 def reset_upload_record(record_id: str) -> bool:
     """Remove processed files and reset completion status for a record."""
     history = load_upload_history()
 
-    for record in history:
-        if record["id"] == record_id:
-            if record.get("deleted"):
-                return False
-            folder = record.get("folder_name")
-            output_dir = OUTPUT_DIR / folder if folder else None
-            try:
-                if output_dir and output_dir.exists():
-                    shutil.rmtree(output_dir)
-            except Exception:
-                pass
+    record = history.by_id.get(record_id)
+    if not record or record.get("deleted"):
+        return False
 
-            # Remove embedding vectors and index entries related to this record
-            if output_dir:
-                index = load_index()
-                keys_to_remove = []
-                for key, meta in index.items():
-                    try:
-                        Path(key).resolve().relative_to(output_dir.resolve())
-                        keys_to_remove.append((key, meta))
-                    except ValueError:
-                        continue
+    folder = record.get("folder_name")
+    output_dir = OUTPUT_DIR / folder if folder else None
+    try:
+        if output_dir and output_dir.exists():
+            shutil.rmtree(output_dir)
+    except Exception:
+        pass
 
-                for key, meta in keys_to_remove:
-                    vector_name = meta.get("vector")
-                    if vector_name:
-                        vector_path = VECTOR_DIR / vector_name
-                        if vector_path.exists():
-                            # Check if this vector is referenced elsewhere
-                            if not any(
-                                v.get("vector") == vector_name and k != key
-                                for k, v in index.items()
-                            ):
-                                try:
-                                    vector_path.unlink()
-                                except Exception:
-                                    pass
-                    del index[key]
+    # Remove embedding vectors and index entries related to this record
+    if output_dir:
+        index = load_index()
+        keys_to_remove = [
+            (key, meta) for key, meta, _ in _index_entries_under(index, output_dir)
+        ]
 
-                if keys_to_remove:
-                    save_index(index)
+        if keys_to_remove:
+            vector_refs = _vector_refcounts(index)
+            for key, meta in keys_to_remove:
+                _release_vector(meta.get("vector"), vector_refs)
+                del index[key]
+            save_index(index)
 
-            record["completed_tasks"] = {
-                task: False for task in TASK_TYPES
-            }
-            record["download_links"] = {}
-            record["title_summary"] = ""
+    record["completed_tasks"] = _EMPTY_TASKS.copy()
+    record["download_links"] = {}
+    record["title_summary"] = ""
 
-            save_upload_history(history)
-            return True
+    save_upload_history(history)
+    return True
+
+
+# file_type -> (file name check, error message) for delete_file
+_DELETE_FILE_TYPE_CHECKS = {
+    'stt': (
+        lambda name: name.endswith('.md'),
+        "STT 파일이 아닙니다.",
+    ),
+    'summary': (
+        lambda name: name.endswith('.summary.md'),
+        "요약 파일이 아닙니다.",
+    ),
+}
 
-    return False
 
 def delete_file(file_identifier: str, file_type: str) -> tuple[bool, str]:
     """Delete a specific file (STT or summary) and update history.
@@ -880,7 +1597,8 @@ def delete_file(file_identifier: str, file_type: str) -> tuple[bool, str]:
     """
     try:
         # Get file info by UUID
-        file_info = get_file_by_uuid(file_identifier)
+        registry = load_file_registry()
+        file_info = registry.get(file_identifier)
         if not file_info:
             return False, "파일을 찾을 수 없습니다."
         
@@ -891,10 +1609,9 @@ def delete_file(file_identifier: str, file_type: str) -> tuple[bool, str]:
             return False, "파일이 존재하지 않습니다."
         
         # Verify file type matches
-        if file_type == 'stt' and not file_path.name.endswith('.md'):
-            return False, "STT 파일이 아닙니다."
-        elif file_type == 'summary' and not file_path.name.endswith('.summary.md'):
-            return False, "요약 파일이 아닙니다."
+        check = _DELETE_FILE_TYPE_CHECKS.get(file_type)
+        if check is not None and not check[0](file_path.name):
+            return False, check[1]
         
         # Delete the file
         try:
@@ -907,27 +1624,22 @@ def delete_file(file_identifier: str, file_type: str) -> tuple[bool, str]:
         history = load_upload_history()
         record_id = file_info["record_id"]
         
-        for record in history:
-            if record["id"] == record_id:
-                if record.get("deleted"):
-                    return False, "삭제된 항목입니다."
-                # Update completion status
-                record["completed_tasks"][file_type] = False
-                
-                # Remove download link
-                if file_type in record["download_links"]:
-                    del record["download_links"][file_type]
-                
-                # If deleting summary, also clear title_summary
-                if file_type == 'summary':
-                    record["title_summary"] = ""
-                
-                break
+        record = history.by_id.get(record_id)
+        if record:
+            if record.get("deleted"):
+                return False, "삭제된 항목입니다."
+            # Update completion status
+            record["completed_tasks"][file_type] = False
+            
+            # Remove download link
+            record["download_links"].pop(file_type, None)
+            
+            # If deleting summary, also clear title_summary
+            if file_type == 'summary':
+                record["title_summary"] = ""
         
         # Remove from file registry
-        registry = load_file_registry()
-        if file_identifier in registry:
-            del registry[file_identifier]
+        if registry.pop(file_identifier, None) is not None:
             save_file_registry(registry)
         
         # Save updated history
@@ -940,38 +1652,108 @@ def delete_file(file_identifier: str, file_type: str) -> tuple[bool, str]:
         return False, f"삭제 중 오류가 발생했습니다: {str(e)}"
 
 
-def _delete_single_record_assets(
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move ``src`` to ``dst`` with a single rename when possible.
+
+    The deleted area normally lives on the same filesystem as the DB folder,
+    so ``os.rename`` succeeds without the extra checks ``shutil.move`` does.
+    A missing target parent is created and the rename retried; only
+    cross-device moves fall back to ``shutil.move``. Any other error is
+    raised.
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno == errno.ENOENT and not dst.parent.exists():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(src, dst)
+                return
+            except OSError as retry_error:
+                e = retry_error
+        if e.errno != errno.EXDEV:
+            raise e
+    shutil.move(str(src), str(dst))
+
+
+def _resolve_asset_roots() -> dict[str, Path]:
+    """Resolve the live and deleted asset roots once for a batch of deletions."""
+    return {
+        "uploads": UPLOAD_DIR.resolve(),
+        "deleted_uploads": DELETED_UPLOAD_DIR.resolve(),
+        "outputs": OUTPUT_DIR.resolve(),
+        "deleted_outputs": DELETED_OUTPUT_DIR.resolve(),
+        "vectors": VECTOR_DIR.resolve(),
+        "deleted_vectors": DELETED_VECTOR_DIR.resolve(),
+    }
+
+
+def _join_record_folder(root: Path, folder_name: str) -> Path:
+    """Join a record folder onto an already resolved root.
+
+    Folder names are single path components (upload UUIDs), so the joined
+    path is already canonical unless the folder itself is a symlink.
+    """
+    path = root / folder_name
+    if folder_name in (".", "..") or len(path.parts) != len(root.parts) + 1 or path.is_symlink():
+        return path.resolve()
+    return path
+
+
+@dataclass
+class _RecordDeletion:
+    """What deleting one record moves and which metadata it rewrites."""
+
+    record: dict
+    deleted_at: str
+    # (deleted_assets key, source dir, target dir)
+    folder_moves: list[tuple[str, Path, Path]]
+    # vectors this record moves; shared ones are claimed by the first record
+    vector_moves: list[tuple[Path, Path]]
+    registry_updates: list[tuple[str, dict, Path]]
+    index_entries: list[tuple[str, dict, Path]]
+    deleted_vector_paths: dict[str, Path]
+
+
+def _plan_record_deletion(
     record: dict,
     registry: dict,
-    index: dict,
+    index: dict | None,
     moved_vector_names: set[str],
-) -> dict:
-    """Move record assets to the deleted area and update metadata."""
+    registry_by_record: dict[str, list[tuple[str, dict]]] | None = None,
+    index_by_folder: dict[str, list[tuple[str, dict, str]]] | None = None,
+    asset_roots: dict[str, Path] | None = None,
+) -> _RecordDeletion:
+    """Work out where a record's assets go without touching the filesystem.
+
+    Batch callers pass ``registry_by_record``/``index_by_folder`` (see
+    :func:`_group_registry_by_record` and :func:`_group_index_by_folder`) so
+    each record only visits its own entries, and ``asset_roots`` (see
+    :func:`_resolve_asset_roots`) so the roots are resolved once per batch.
+    """
 
     record_id = record.get("id")
     folder_name = record.get("folder_name")
     deleted_at = datetime.now().isoformat()
 
-    upload_dir = (UPLOAD_DIR / folder_name).resolve() if folder_name else None
-    deleted_upload_dir = (DELETED_UPLOAD_DIR / folder_name).resolve() if folder_name else None
-    output_dir = (OUTPUT_DIR / folder_name).resolve() if folder_name else None
-    deleted_output_dir = (DELETED_OUTPUT_DIR / folder_name).resolve() if folder_name else None
-    vector_dir = VECTOR_DIR.resolve()
-    deleted_vector_dir = DELETED_VECTOR_DIR.resolve()
+    if asset_roots is None:
+        asset_roots = _resolve_asset_roots()
 
-    registry_changed = False
-    index_changed = False
+    upload_dir = deleted_upload_dir = output_dir = deleted_output_dir = None
+    if folder_name:
+        upload_dir = _join_record_folder(asset_roots["uploads"], folder_name)
+        deleted_upload_dir = _join_record_folder(asset_roots["deleted_uploads"], folder_name)
+        output_dir = _join_record_folder(asset_roots["outputs"], folder_name)
+        deleted_output_dir = _join_record_folder(asset_roots["deleted_outputs"], folder_name)
+    vector_dir = asset_roots["vectors"]
+    deleted_vector_dir = asset_roots["deleted_vectors"]
 
-    files_assets: dict[str, list[str]] = {}
-    record_assets: dict[str, Any] = {}
+    if registry_by_record is None:
+        registry_by_record = _group_registry_by_record(registry or {})
 
     registry_updates: list[tuple[str, dict, Path]] = []
-    for file_uuid, info in (registry or {}).items():
-        if not isinstance(info, dict):
-            continue
-        if info.get("record_id") != record_id:
-            continue
-
+    for file_uuid, info in registry_by_record.get(record_id, ()):
         file_path_str = info.get("file_path")
         if not file_path_str:
             continue
@@ -983,24 +1765,18 @@ def _delete_single_record_assets(
 
         new_path: Path | None = None
         if absolute_path is not None:
-            if upload_dir:
-                try:
-                    rel = absolute_path.relative_to(upload_dir)
-                    new_path = deleted_upload_dir / rel
-                except ValueError:
-                    pass
-            if new_path is None and output_dir:
-                try:
-                    rel = absolute_path.relative_to(output_dir)
-                    new_path = deleted_output_dir / rel
-                except ValueError:
-                    pass
-            if new_path is None:
-                try:
-                    rel = absolute_path.relative_to(vector_dir)
-                    new_path = deleted_vector_dir / rel
-                except ValueError:
-                    pass
+            candidates = (
+                (upload_dir, deleted_upload_dir),
+                (output_dir, deleted_output_dir),
+                (vector_dir, deleted_vector_dir),
+            )
+            for source_root, deleted_root in candidates:
+                if source_root is None:
+                    continue
+                rel = relative_path_or_none(absolute_path, source_root)
+                if rel is not None:
+                    new_path = deleted_root / rel
+                    break
 
         if new_path is None:
             continue
@@ -1010,14 +1786,11 @@ def _delete_single_record_assets(
     index_entries: list[tuple[str, dict, Path]] = []
     vector_names: set[str] = set()
     if output_dir:
-        for key, meta in (index or {}).items():
-            if not isinstance(meta, dict):
-                continue
-            try:
-                rel = Path(key).resolve().relative_to(output_dir)
-            except (ValueError, FileNotFoundError):
-                continue
-
+        if index_by_folder is not None:
+            record_index_entries = index_by_folder.get(folder_name, ())
+        else:
+            record_index_entries = _index_entries_under(index or {}, output_dir)
+        for key, meta, rel in record_index_entries:
             deleted_path = (deleted_output_dir / rel) if deleted_output_dir else None
             if deleted_path is None:
                 continue
@@ -1028,17 +1801,64 @@ def _delete_single_record_assets(
             if vector_name:
                 vector_names.add(vector_name)
 
-    if upload_dir and upload_dir.exists():
-        deleted_upload_dir.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(upload_dir), str(deleted_upload_dir))
-        record_assets["uploads"] = to_record_path(deleted_upload_dir)
+    folder_moves: list[tuple[str, Path, Path]] = []
+    if upload_dir:
+        folder_moves.append(("uploads", upload_dir, deleted_upload_dir))
+    if output_dir:
+        folder_moves.append(("outputs", output_dir, deleted_output_dir))
+
+    # Build each deleted vector path once and share it between the index
+    # metadata and the record's asset list.
+    deleted_vector_paths = {
+        vector_name: DELETED_VECTOR_DIR / vector_name for vector_name in vector_names
+    }
+
+    vector_moves: list[tuple[Path, Path]] = []
+    for vector_name, target_path in deleted_vector_paths.items():
+        if vector_name not in moved_vector_names:
+            vector_moves.append((VECTOR_DIR / vector_name, target_path))
+            moved_vector_names.add(vector_name)
+
+    return _RecordDeletion(
+        record=record,
+        deleted_at=deleted_at,
+        folder_moves=folder_moves,
+        vector_moves=vector_moves,
+        registry_updates=registry_updates,
+        index_entries=index_entries,
+        deleted_vector_paths=deleted_vector_paths,
+    )
+
 
-    if output_dir and output_dir.exists():
-        deleted_output_dir.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(output_dir), str(deleted_output_dir))
-        record_assets["outputs"] = to_record_path(deleted_output_dir)
+def _move_record_assets(plan: _RecordDeletion) -> dict[str, Path]:
+    """Move a planned record's folders and vectors into the deleted area.
 
-    for file_uuid, info, new_path in registry_updates:
+    Only touches the filesystem, so plans can be applied from worker threads.
+    Returns the target of every folder that existed and was moved.
+    """
+    moved: dict[str, Path] = {}
+    for asset_key, source, target in plan.folder_moves:
+        if source.exists():
+            _fast_move(source, target)
+            moved[asset_key] = target
+    for source, target in plan.vector_moves:
+        if source.exists():
+            _fast_move(source, target)
+    return moved
+
+
+def _commit_record_deletion(plan: _RecordDeletion, moved: dict[str, Path]) -> dict:
+    """Mark a record and its registry/index entries deleted after its move."""
+    deleted_at = plan.deleted_at
+    registry_changed = False
+    index_changed = False
+
+    record_assets: dict[str, Any] = {
+        asset_key: to_record_path(target) for asset_key, target in moved.items()
+    }
+
+    files_assets: dict[str, list[str]] = {}
+    for file_uuid, info, new_path in plan.registry_updates:
         info["file_path"] = to_record_path(new_path)
         info["deleted"] = True
         info["deleted_at"] = deleted_at
@@ -1050,30 +1870,22 @@ def _delete_single_record_assets(
     if files_assets:
         record_assets["files"] = files_assets
 
-    moved_vector_paths: list[str] = []
-    for key, meta, deleted_path in index_entries:
+    for key, meta, deleted_path in plan.index_entries:
         meta["deleted"] = True
         meta["deleted_at"] = deleted_at
         meta["deleted_path"] = str(deleted_path)
         vector_name = meta.get("vector")
         if vector_name:
-            deleted_vector_path = DELETED_VECTOR_DIR / vector_name
-            meta["vector_deleted_path"] = str(deleted_vector_path)
+            meta["vector_deleted_path"] = str(plan.deleted_vector_paths[vector_name])
         index_changed = True
 
-    for vector_name in vector_names:
-        target_path = DELETED_VECTOR_DIR / vector_name
-        if vector_name not in moved_vector_names:
-            source_path = VECTOR_DIR / vector_name
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            if source_path.exists():
-                shutil.move(str(source_path), str(target_path))
-            moved_vector_names.add(vector_name)
-        moved_vector_paths.append(to_record_path(target_path))
-
-    if moved_vector_paths:
-        record_assets["vectors"] = moved_vector_paths
+    record_vector_paths = [
+        to_record_path(target_path) for target_path in plan.deleted_vector_paths.values()
+    ]
+    if record_vector_paths:
+        record_assets["vectors"] = record_vector_paths
 
+    record = plan.record
     record["deleted"] = True
     record["deleted_at"] = deleted_at
     record["deleted_assets"] = record_assets
@@ -1084,18 +1896,35 @@ def _delete_single_record_assets(
     }
 
 
+DELETE_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
 def delete_records(record_ids: list[str]) -> tuple[bool, dict[str, dict]]:
-    """Delete multiple upload records by moving their assets to a deleted folder."""
+    """Delete multiple upload records by moving their assets to a deleted folder.
+
+    Deletions are planned one record at a time, the moves for all records run
+    on a small thread pool, and the metadata of every record whose move
+    succeeded is updated afterwards on this thread.
+    """
 
     if not record_ids:
         return False, {}
 
     history = load_upload_history()
     registry = load_file_registry()
-    index = load_index()
+    # The index is only loaded once a record with an output folder shows up.
+    index = None
+    index_by_folder = None
 
-    history_by_id = {record.get("id"): record for record in history}
+    history_by_id = history.by_id
     results: dict[str, dict] = {}
+    plans: dict[str, _RecordDeletion] = {}
+
+    for deleted_dir in (DELETED_UPLOAD_DIR, DELETED_OUTPUT_DIR, DELETED_VECTOR_DIR):
+        deleted_dir.mkdir(parents=True, exist_ok=True)
+
+    registry_by_record = _group_registry_by_record(registry)
+    asset_roots = _resolve_asset_roots()
 
     history_changed = False
     registry_changed = False
@@ -1111,25 +1940,60 @@ def delete_records(record_ids: list[str]) -> tuple[bool, dict[str, dict]]:
             }
             continue
 
-        if record.get("deleted"):
+        if record.get("deleted") or record_id in plans:
             results[record_id] = {
                 "success": False,
                 "error": "이미 삭제된 항목입니다.",
             }
             continue
 
+        if index is None and record.get("folder_name"):
+            index = load_index()
+            index_by_folder = _group_index_by_folder(index)
+
         try:
-            summary = _delete_single_record_assets(record, registry, index, moved_vector_names)
-            history_changed = True
-            registry_changed = registry_changed or summary.get("registry_changed", False)
-            index_changed = index_changed or summary.get("index_changed", False)
-            results[record_id] = {"success": True}
+            plans[record_id] = _plan_record_deletion(
+                record,
+                registry,
+                index,
+                moved_vector_names,
+                registry_by_record,
+                index_by_folder,
+                asset_roots,
+            )
         except Exception as exc:
             results[record_id] = {
                 "success": False,
                 "error": str(exc),
             }
 
+    def move(plan: _RecordDeletion):
+        try:
+            return _move_record_assets(plan), None
+        except Exception as exc:
+            return None, exc
+
+    # Renames release the GIL, so moves for different records can overlap.
+    if len(plans) > 1:
+        workers = min(DELETE_MAX_WORKERS, len(plans))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(move, plans.values()))
+    else:
+        outcomes = [move(plan) for plan in plans.values()]
+
+    for (record_id, plan), (moved, error) in zip(plans.items(), outcomes):
+        if error is not None:
+            results[record_id] = {
+                "success": False,
+                "error": str(error),
+            }
+            continue
+        summary = _commit_record_deletion(plan, moved)
+        history_changed = True
+        registry_changed = registry_changed or summary.get("registry_changed", False)
+        index_changed = index_changed or summary.get("index_changed", False)
+        results[record_id] = {"success": True}
+
     if history_changed:
         save_upload_history(history)
     if registry_changed:
@@ -1137,6 +2001,9 @@ def delete_records(record_ids: list[str]) -> tuple[bool, dict[str, dict]]:
     if index_changed:
         save_index(index)
 
+    # Report in request order
+    results = {record_id: results[record_id] for record_id in record_ids if record_id in results}
+
     overall_success = (
         bool(results)
         and all(result.get("success") for result in results.values())
@@ -1171,19 +2038,16 @@ def update_stt_text(file_identifier: str, new_text: str) -> tuple[bool, str, str
         return False, "텍스트를 저장하지 못했습니다.", record_id
 
     if not record_id:
-        history = load_upload_history()
-        resolved_path = file_path.resolve()
-        for record in history:
-            folder = record.get("folder_name")
-            if not folder:
-                continue
-            output_dir = (OUTPUT_DIR / folder).resolve()
-            try:
-                resolved_path.relative_to(output_dir)
-                record_id = record["id"]
-                break
-            except ValueError:
-                continue
+        # Records own ``OUTPUT_DIR/<folder_name>``, so resolve the path once
+        # and match its first component instead of resolving every record.
+        relative = relative_path_or_none(file_path.resolve(), OUTPUT_DIR.resolve())
+        folder = relative.parts[0] if relative is not None and relative.parts else None
+        if folder:
+            history = _history_snapshot()
+            record_id = next(
+                (record["id"] for record in history if record.get("folder_name") == folder),
+                None,
+            )
 
     return True, "", record_id
 
@@ -1193,15 +2057,20 @@ def reset_tasks_for_record(
     tasks: set[str],
     registry: dict,
     index: dict,
+    vector_refs: Counter | None = None,
 ) -> tuple[dict[str, bool], bool, bool]:
-    """Reset selected task artifacts for a single record."""
+    """Reset selected task artifacts for a single record.
+
+    ``vector_refs`` may be shared across calls on the same ``index`` so the
+    vector reference counts are only computed once per batch.
+    """
 
-    results = {task: False for task in TASK_TYPES}
+    results = _EMPTY_TASKS.copy()
     if not record or not tasks or record.get("deleted"):
         return results, False, False
 
     download_links = record.get("download_links", {})
-    completed_tasks = record.setdefault("completed_tasks", {task: False for task in TASK_TYPES})
+    completed_tasks = record.setdefault("completed_tasks", _EMPTY_TASKS.copy())
 
     registry_changed = False
     index_changed = False
@@ -1213,7 +2082,7 @@ def reset_tasks_for_record(
         if not link:
             return False
 
-        file_path, _, _, resolved_identifier = resolve_file_identifier(link)
+        file_path, _, _, resolved_identifier = resolve_file_identifier(link, registry)
 
         if delete_file and file_path and file_path.exists():
             try:
@@ -1238,11 +2107,16 @@ def reset_tasks_for_record(
                 if normalized.startswith(f"{DB_ALIAS}/"):
                     candidates.add(normalized[len(DB_ALIAS) + 1 :])
 
-                for key, info in list(registry.items()):
-                    stored_path = normalize_record_path(info.get("file_path", ""))
-                    if info.get("task_type") == task_name and stored_path in candidates:
-                        del registry[key]
-                        registry_changed = True
+                entry_paths = _registry_entry_paths()
+                stale_keys = [
+                    key for key, info in registry.items()
+                    if info.get("task_type") == task_name
+                    and _stored_paths(key, info, entry_paths)[0] in candidates
+                ]
+                for key in stale_keys:
+                    del registry[key]
+                if stale_keys:
+                    registry_changed = True
 
         download_links.pop(task_name, None)
         completed_tasks[task_name] = False
@@ -1269,30 +2143,15 @@ def reset_tasks_for_record(
         try:
             folder_name = record.get("folder_name", "")
             output_dir = OUTPUT_DIR / folder_name
-            output_resolved = output_dir.resolve()
-            keys_to_remove = []
-
-            for key, meta in list(index.items()):
-                try:
-                    Path(key).resolve().relative_to(output_resolved)
-                    keys_to_remove.append((key, meta))
-                except (ValueError, FileNotFoundError):
-                    continue
+            keys_to_remove = [
+                (key, meta) for key, meta, _ in _index_entries_under(index, output_dir)
+            ]
 
             if keys_to_remove:
+                if vector_refs is None:
+                    vector_refs = _vector_refcounts(index)
                 for key, meta in keys_to_remove:
-                    vector_name = meta.get("vector")
-                    if vector_name:
-                        vector_path = VECTOR_DIR / vector_name
-                        if vector_path.exists():
-                            if not any(
-                                v.get("vector") == vector_name and k != key
-                                for k, v in index.items()
-                            ):
-                                try:
-                                    vector_path.unlink()
-                                except Exception:
-                                    pass
+                    _release_vector(meta.get("vector"), vector_refs)
                     del index[key]
 
                 index_changed = True
@@ -1327,7 +2186,7 @@ def reset_summary_and_embedding(record_id: str) -> tuple[bool, str]:
         return False, "record_id가 필요합니다."
 
     history = load_upload_history()
-    record = next((item for item in history if item.get("id") == record_id), None)
+    record = history.by_id.get(record_id)
 
     if not record:
         return False, "기록을 찾을 수 없습니다."
@@ -1384,6 +2243,7 @@ def reset_tasks_for_all_records(tasks: set[str]) -> tuple[bool, dict[str, int],
     registry_changed = False
     index_changed = False
     reset_counts = {task: 0 for task in valid_tasks}
+    vector_refs = _vector_refcounts(index) if "embedding" in requested_tasks else None
 
     for record in history:
         if record.get("deleted"):
@@ -1393,6 +2253,7 @@ def reset_tasks_for_all_records(tasks: set[str]) -> tuple[bool, dict[str, int],
             requested_tasks,
             registry,
             index,
+            vector_refs,
         )
 
         if reg_changed:
@@ -1783,7 +2644,7 @@ def run_workflow(file_path: Path, steps, record_id: str = None, task_id: str = N
                     # 원본 파일명 추출 (DB에서 조회)
                     original_filename = None
                     if record_id:
-                        history = load_upload_history()
+                        history = _history_snapshot()
                         for rec in history:
                             if rec.get("id") == record_id:
                                 original_filename = rec.get("info", {}).get("original_filename")
@@ -1932,11 +2793,7 @@ class UploadHandler(BaseHTTPRequestHandler):
 
     def _is_uuid(self, test_string: str) -> bool:
         """Check if a string is a valid UUID."""
-        try:
-            uuid.UUID(test_string)
-            return True
-        except ValueError:
-            return False
+        return is_valid_uuid(test_string)
 
     def do_GET(self):
         if self.path == "/":
@@ -2173,8 +3030,13 @@ class UploadHandler(BaseHTTPRequestHandler):
             
             # Filter out the current document itself and limit to top 5
             similar_docs = []
-            registry = load_file_registry()
+            registry = _registry_snapshot()
             print(f"[DEBUG] 레지스트리에 등록된 파일 수: {len(registry)}")
+            entry_paths = _registry_entry_paths()
+            uuid_by_path = {}
+            for uuid_key, file_info in registry.items():
+                stored_norm = os.path.normpath(_stored_paths(uuid_key, file_info, entry_paths)[0])
+                uuid_by_path.setdefault(stored_norm, uuid_key)
 
             current_path_norm = os.path.normpath(normalize_record_path(file_path))
             for hit in hits:
@@ -2184,12 +3046,7 @@ class UploadHandler(BaseHTTPRequestHandler):
                 # Skip if it's the same file (compare normalized paths)
                 if hit_path_norm != current_path_norm:
                     # Try to find UUID for this file in registry
-                    file_uuid = None
-                    for uuid_key, file_info in registry.items():
-                        stored_norm = os.path.normpath(normalize_record_path(file_info["file_path"]))
-                        if stored_norm == hit_path_norm:
-                            file_uuid = uuid_key
-                            break
+                    file_uuid = uuid_by_path.get(hit_path_norm)
 
                     # Use UUID if available, otherwise fallback to path
                     download_link = f"/download/{file_uuid}" if file_uuid else f"/download/{normalized_hit}"
@@ -2277,8 +3134,13 @@ class UploadHandler(BaseHTTPRequestHandler):
             
             # Filter out the current document itself and limit to top 5
             similar_docs = []
-            registry = load_file_registry()
-            history = load_upload_history()
+            registry = _registry_snapshot()
+            history = _history_snapshot()
+            entry_paths = _registry_entry_paths()
+            registry_by_path = {}
+            for uuid_key, file_info in registry.items():
+                stored_norm = os.path.normpath(_stored_paths(uuid_key, file_info, entry_paths)[0])
+                registry_by_path.setdefault(stored_norm, (uuid_key, file_info))
 
             current_path_norm = os.path.normpath(normalize_record_path(file_path))
             for hit in hits:
@@ -2289,22 +3151,18 @@ class UploadHandler(BaseHTTPRequestHandler):
                     # Try to find UUID for this file in registry
                     file_uuid = None
                     record_id = None
-                    for uuid_key, file_info in registry.items():
-                        stored_norm = os.path.normpath(normalize_record_path(file_info["file_path"]))
-                        if stored_norm == hit_path_norm:
-                            file_uuid = uuid_key
-                            record_id = file_info.get("record_id")
-                            break
+                    registered = registry_by_path.get(hit_path_norm)
+                    if registered:
+                        file_uuid, file_info = registered
+                        record_id = file_info.get("record_id")
 
                     # Find user filename from history if available
                     user_filename_found = None
                     title_summary = ""
-                    if record_id:
-                        for record in history:
-                            if record["id"] == record_id:
-                                user_filename_found = record.get("filename")
-                                title_summary = (record.get("title_summary") or "").strip()
-                                break
+                    record = history.by_id.get(record_id) if record_id else None
+                    if record:
+                        user_filename_found = record.get("filename")
+                        title_summary = (record.get("title_summary") or "").strip()
 
                     # Use UUID if available, otherwise fallback to path
                     download_link = f"/download/{file_uuid}" if file_uuid else f"/download/{normalized_hit}"
@@ -2402,35 +3260,6 @@ class UploadHandler(BaseHTTPRequestHandler):
 
         threading.Thread(target=shutdown_server, daemon=True).start()
 
-    def _parse_multipart(self, data, boundary):
-        """Simple multipart/form-data parser"""
-        parts = data.split(f'--{boundary}'.encode())
-        files = {}
-
-        for part in parts[1:-1]:  # Skip first empty and last closing parts
-            if b'Content-Disposition' not in part:
-                continue
-
-            headers, body = part.split(b'\r\n\r\n', 1)
-            headers = headers.decode('utf-8')
-            body = body.rstrip(b'\r\n')
-
-            # Extract filename from Content-Disposition header
-            if 'filename=' in headers:
-                filename_match = re.search(r'filename="([^"]*)"', headers)
-                name_match = re.search(r'name="([^"]*)"', headers)
-
-                if filename_match and name_match:
-                    filename = filename_match.group(1)
-                    name = name_match.group(1)
-
-                    files.setdefault(name, []).append({
-                        'filename': filename,
-                        'data': body
-                    })
-
-        return files
-
     def do_POST(self):
         if self.path == "/upload":
             try:
@@ -2456,61 +3285,69 @@ class UploadHandler(BaseHTTPRequestHandler):
                 
                 boundary = boundary_match.group(1).strip()
                 content_length = int(self.headers.get('Content-Length', 0))
-                data = self.rfile.read(content_length)
-                
-                files = self._parse_multipart(data, boundary)
-                print(f"Parsed fields: {list(files.keys())}")
-
-                file_entries = files.get('files') or files.get('file')
-                if not file_entries:
-                    print("Upload failed: No files provided")
-                    self.send_response(400)
-                    self.end_headers()
-                    self.wfile.write(b"No file uploaded")
-                    return
-
-                history = load_upload_history()
-                uploaded_files = []
-                for file_info in file_entries:
-                    if not file_info.get('filename'):
-                        continue
+                files = stream_multipart_files(self.rfile, boundary, content_length)
+                try:
+                    print(f"Parsed fields: {list(files.keys())}")
+
+                    file_entries = files.get('files') or files.get('file')
+                    if not file_entries:
+                        print("Upload failed: No files provided")
+                        self.send_response(400)
+                        self.end_headers()
+                        self.wfile.write(b"No file uploaded")
+                        return
+
+                    # First record per hash, including files added by this request
+                    records_by_hash = {}
+                    for r in _history_snapshot():
+                        if r.get('file_hash'):
+                            records_by_hash.setdefault(r['file_hash'], r)
+
+                    uploaded_files = []
+                    for file_info in file_entries:
+                        if not file_info.get('filename'):
+                            continue
 
-                    file_hash = compute_file_hash(file_info['data'])
-                    existing = next((r for r in history if r.get('file_hash') == file_hash), None)
-                    if existing:
-                        uploaded_files.append({
-                            "duplicate": True,
-                            "original_record_id": existing["id"],
-                            "filename": file_info['filename']
-                        })
-                        continue
+                        file_hash = file_info['file_hash']
+                        existing = records_by_hash.get(file_hash)
+                        if existing:
+                            uploaded_files.append({
+                                "duplicate": True,
+                                "original_record_id": existing["id"],
+                                "filename": file_info['filename']
+                            })
+                            continue
 
-                    uid = uuid.uuid4().hex
-                    save_dir = UPLOAD_DIR / uid
-                    save_dir.mkdir(parents=True, exist_ok=True)
-                    file_path = save_dir / os.path.basename(file_info['filename'])
+                        uid = uuid.uuid4().hex
+                        save_dir = UPLOAD_DIR / uid
+                        save_dir.mkdir(parents=True, exist_ok=True)
+                        file_path = save_dir / os.path.basename(file_info['filename'])
 
-                    with open(file_path, "wb") as output_file:
-                        output_file.write(file_info['data'])
+                        os.replace(file_info['temp_path'], file_path)
 
-                    print(f"File saved successfully: {file_path}")
+                        print(f"File saved successfully: {file_path}")
 
-                    file_type = get_file_type(file_path)
+                        file_type = get_file_type(file_path)
 
-                    # Get audio duration if it's an audio file
-                    duration = None
-                    if file_type == 'audio':
-                        duration = get_audio_duration(file_path)
+                        # Get audio duration if it's an audio file
+                        duration = None
+                        if file_type == 'audio':
+                            duration = get_audio_duration(file_path)
 
-                    # Add to upload history
-                    record = add_upload_record(file_path, file_type, duration, file_hash)
-                    history.insert(0, record)
+                        # Add to upload history
+                        record = add_upload_record(file_path, file_type, duration, file_hash)
+                        records_by_hash.setdefault(file_hash, record)
 
-                    uploaded_files.append({
-                        "file_path": to_record_path(file_path),
-                        "file_type": file_type,
-                        "record_id": record["id"]
-                    })
+                        uploaded_files.append({
+                            "file_path": to_record_path(file_path),
+                            "file_type": file_type,
+                            "record_id": record["id"]
+                        })
+                finally:
+                    # Drop temp files of duplicates and of unused fields
+                    for entries in files.values():
+                        for file_info in entries:
+                            file_info['temp_path'].unlink(missing_ok=True)
 
                 self.send_response(200)
                 self.send_header("Content-Type", "application/json")
@@ -2610,7 +3447,6 @@ class UploadHandler(BaseHTTPRequestHandler):
                 self.wfile.write(b"Invalid JSON payload")
                 return
             record_id = payload.get("record_id")
-
             if not record_id:
                 self.send_response(400)
                 self.end_headers()
@@ -2937,6 +3773,11 @@ if __name__ == "__main__":
     DELETED_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     DELETED_VECTOR_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Normalize stored records once so regular loads can skip it
+    migrate_store_schemas()
+    # Fold the index journal (and upgrade a legacy index.json) before serving
+    compact_index()
+
     # Migrate existing files to UUID system
     migrate_existing_files()
 
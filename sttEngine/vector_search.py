@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import numpy as np
 import json
@@ -13,14 +14,83 @@ from embedding_pipeline import (
     INDEX_FILE,
     VECTOR_DIR,
     embed_text_ollama,
+    entry_datetime,
+    index_signature,
     load_index,
     resolve_index_path,
 )
-from search_cache import get_cached_search_result, cache_search_result
+from search_cache import SEMANTIC_CACHE, get_cached_search_result, cache_search_result
 
 # 설정 모듈 임포트
 sys.path.append(str(Path(__file__).parent / "sttEngine"))
-from config import get_default_model, get_model_for_task, normalize_db_record_path
+from config import (
+    get_default_model,
+    get_model_for_task,
+    normalize_db_record_path,
+    relative_path_or_none,
+)
+
+
+# 검색마다 벡터 파일을 하나씩 읽지 않도록 정규화된 문서 벡터를 하나의 행렬로
+# 쌓아 두고, 인덱스 항목(키, 벡터 파일, sha256)이 바뀔 때만 다시 만든다.
+_matrix_lock = threading.Lock()
+_matrix_signature: Optional[tuple] = None
+_matrix = np.empty((0, 0), dtype=np.float32)
+_matrix_rows: List[str] = []
+# (벡터 파일명, sha256) -> 행렬의 해당 행 (재구성 시 바뀌지 않은 벡터 재사용)
+_unit_vectors: Dict[Tuple[str, Optional[str]], np.ndarray] = {}
+
+
+def _load_unit_vector(vector_name: str) -> Optional[np.ndarray]:
+    """벡터 파일을 읽어 L2 정규화한 값 반환 (파일이 없거나 영벡터면 None)"""
+    try:
+        vec = np.load(VECTOR_DIR / vector_name)
+    except (OSError, ValueError):
+        return None
+    vec = np.asarray(vec, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    if not norm:
+        return None
+    return vec / norm
+
+
+def _document_matrix(index: Dict[str, Dict[str, Any]], dim: int) -> Tuple[np.ndarray, List[str]]:
+    """삭제되지 않은 항목들의 정규화 벡터 행렬과 각 행의 인덱스 키 반환
+
+    차원이 ``dim``과 다른 벡터(다른 임베딩 모델로 만든 것)는 제외한다.
+    """
+    global _matrix_signature, _matrix, _matrix_rows, _unit_vectors
+
+    signature = (dim,) + tuple(
+        (key, meta["vector"], meta.get("sha256"))
+        for key, meta in index.items()
+        if isinstance(meta, dict) and not meta.get("deleted") and meta.get("vector")
+    )
+    with _matrix_lock:
+        if signature == _matrix_signature:
+            return _matrix, _matrix_rows
+
+        rows: List[str] = []
+        parts: List[np.ndarray] = []
+        cache_keys: List[Tuple[str, Optional[str]]] = []
+        for key, vector_name, sha256 in signature[1:]:
+            cache_key = (vector_name, sha256)
+            vec = _unit_vectors.get(cache_key)
+            # 임베딩 모델이 바뀌면 같은 문서(sha256)의 .npy가 다른 차원으로 다시
+            # 만들어지므로, 캐시된 벡터의 차원이 다르면 파일에서 다시 읽는다
+            if vec is None or vec.shape[0] != dim:
+                vec = _load_unit_vector(vector_name)
+            if vec is None or vec.shape[0] != dim:
+                continue
+            rows.append(key)
+            parts.append(vec)
+            cache_keys.append(cache_key)
+
+        matrix = np.vstack(parts) if parts else np.empty((0, dim), dtype=np.float32)
+        # 사전에는 새 행렬의 행(view)을 두어 벡터를 두 번 보관하지 않음
+        _unit_vectors = {cache_key: matrix[row] for row, cache_key in enumerate(cache_keys)}
+        _matrix, _matrix_rows, _matrix_signature = matrix, rows, signature
+        return matrix, rows
 
 
 def search(query: str, base_dir: Path, top_k: int = 10,
@@ -45,55 +115,64 @@ def search(query: str, base_dir: Path, top_k: int = 10,
     
     try:
         query_vec = embed_text_ollama(query, model_name)
+
+        # 임베딩이 거의 같은 이전 쿼리의 결과 재사용. 인덱스를 읽기 전에 버전을
+        # 구해 두므로, 그 뒤의 변경이 이번 결과의 버전으로 기록되지 않는다.
+        semantic_key = (top_k, start_date, end_date)
+        index_version = index_signature()
+        similar_results = SEMANTIC_CACHE.get(semantic_key, query_vec, index_version)
+        if similar_results is not None:
+            print(f"유사 쿼리 캐시에서 검색 결과 반환: {len(similar_results)}개 항목")
+            return similar_results
+
         index = load_index()
         results: List[Dict[str, Any]] = []
 
         start_dt = datetime.fromisoformat(start_date) if start_date else None
         end_dt = datetime.fromisoformat(end_date) if end_date else None
 
-        for path_str, meta in index.items():
-            if isinstance(meta, dict) and meta.get("deleted"):
-                continue
-            timestamp_str = meta.get("timestamp")
+        query_vec = np.asarray(query_vec, dtype=np.float32).ravel()
+        query_norm = float(np.linalg.norm(query_vec))
+        matrix, rows = _document_matrix(index, query_vec.shape[0])
+        if query_norm and rows:
+            # cosine similarity: 행렬 행은 이미 정규화되어 있음
+            scores = matrix @ (query_vec / query_norm)
+
+            candidates = np.arange(len(rows))
             if start_dt or end_dt:
-                if not timestamp_str:
-                    continue
+                keep = []
+                for row, path_str in enumerate(rows):
+                    doc_time = entry_datetime(index[path_str])
+                    if doc_time is None:
+                        continue
+                    if start_dt and doc_time < start_dt:
+                        continue
+                    if end_dt and doc_time > end_dt:
+                        continue
+                    keep.append(row)
+                candidates = np.array(keep, dtype=np.intp)
+
+            # 점수가 같으면 인덱스 순서를 유지 (stable), 상위 top_k만 경로 변환
+            order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+            for row in order:
+                path_str = rows[row]
+                meta = index[path_str]
                 try:
-                    doc_time = datetime.fromisoformat(timestamp_str)
-                except ValueError:
-                    continue
-                if start_dt and doc_time < start_dt:
-                    continue
-                if end_dt and doc_time > end_dt:
-                    continue
-
-            vec_file = VECTOR_DIR / meta.get("vector", "")
-            if not vec_file.exists():
-                continue
-            doc_vec = np.load(vec_file)
-            # cosine similarity
-            denom = (np.linalg.norm(query_vec) * np.linalg.norm(doc_vec))
-            if denom == 0:
-                continue
-            score = float(np.dot(query_vec, doc_vec) / denom)
-            try:
-                resolved_path = resolve_index_path(path_str, meta if isinstance(meta, dict) else None)
-            except Exception:
-                resolved_path = Path(path_str).resolve()
-            try:
-                rel_path = str(resolved_path.relative_to(base_dir))
-            except ValueError:
-                rel_path = resolved_path.as_posix()
-
-            rel_path = normalize_db_record_path(rel_path, base_dir)
-            results.append({"file": rel_path, "score": score})
-        
-        results.sort(key=lambda x: x["score"], reverse=True)
-        final_results = results[:top_k]
+                    resolved_path = resolve_index_path(path_str, meta)
+                except Exception:
+                    resolved_path = Path(path_str).resolve()
+                relative = relative_path_or_none(resolved_path, base_dir)
+                rel_path = str(relative) if relative is not None else resolved_path.as_posix()
+
+                rel_path = normalize_db_record_path(rel_path, base_dir)
+                results.append({"file": rel_path, "score": float(scores[row])})
+
+        final_results = results
         
         # 결과를 캐시에 저장
         cache_search_result(query, top_k, final_results,
                             start_date=start_date, end_date=end_date)
+        SEMANTIC_CACHE.put(semantic_key, query_vec, final_results, index_version)
         print(f"새로운 검색 결과를 캐시에 저장: {len(final_results)}개 항목")
         
         return final_results
@@ -1,5 +1,6 @@
 # summarize.py
 import argparse
+import codecs
 import json
 import logging
 import platform
@@ -221,23 +222,50 @@ def strip_prefix_before_bracket(text: str) -> str:
             processed_lines.append(line)
     return "\n".join(processed_lines)
 
-def read_text_with_fallback(path: Path, encoding: str = "utf-8") -> str:
-    """인코딩 fallback을 지원하는 텍스트 읽기"""
-    encodings = [encoding, "utf-8", "cp949", "euc-kr", "latin-1"]
-    
-    for enc in encodings:
+def decode_text_with_fallback(raw: bytes, encoding: str = "utf-8", final: bool = True) -> Optional[str]:
+    """이미 읽은 바이트를 인코딩 fallback으로 디코딩 (모두 실패하면 None)
+
+    ``final=False``이면 잘린 마지막 멀티바이트 문자는 오류 대신 버려진다.
+    줄바꿈은 텍스트 모드 읽기와 같이 ``\\n``으로 통일한다.
+    """
+    for enc in [encoding, "utf-8", "cp949", "euc-kr", "latin-1"]:
         try:
-            content = path.read_text(encoding=enc)
-            if enc != encoding:
-                logging.info(f"인코딩 변경: {encoding} → {enc}")
-            return content
+            content = codecs.getincrementaldecoder(enc)().decode(raw, final=final)
         except UnicodeDecodeError:
             continue
         except Exception as e:
-            logging.error(f"파일 읽기 실패 ({enc}): {e}")
+            logging.error(f"파일 디코딩 실패 ({enc}): {e}")
             continue
-    
-    raise SummarizationError(f"모든 인코딩으로 파일 읽기 실패: {path}")
+        if enc != encoding:
+            logging.info(f"인코딩 변경: {encoding} → {enc}")
+        return content.replace("\r\n", "\n").replace("\r", "\n")
+    return None
+
+
+def read_text_with_fallback(path: Path, encoding: str = "utf-8", max_chars: Optional[int] = None) -> str:
+    """인코딩 fallback을 지원하는 텍스트 읽기
+
+    파일은 한 번만 읽고 인코딩별 디코딩만 반복한다. ``max_chars``를 지정하면
+    파일 앞부분(문자당 최대 4바이트)만 읽어 최대 ``max_chars`` 글자까지 반환한다.
+    """
+    try:
+        with open(path, "rb") as f:
+            if max_chars is None:
+                raw = f.read()
+                at_eof = True
+            else:
+                byte_limit = max_chars * 4
+                raw = f.read(byte_limit + 1)
+                at_eof = len(raw) <= byte_limit
+                raw = raw[:byte_limit]
+    except Exception as e:
+        logging.error(f"파일 읽기 실패: {e}")
+        raise SummarizationError(f"모든 인코딩으로 파일 읽기 실패: {path}")
+
+    content = decode_text_with_fallback(raw, encoding, final=at_eof)
+    if content is None:
+        raise SummarizationError(f"모든 인코딩으로 파일 읽기 실패: {path}")
+    return content if max_chars is None else content[:max_chars]
 
 def chunk_text(text: str, max_bytes: int, target_chunks: Optional[int] = None) -> List[str]:
     """텍스트를 바이트 단위로 청크 분할 (안전한 방식)"""
@@ -554,6 +582,79 @@ def read_from_stdin() -> str:
     except Exception as e:
         raise SummarizationError(f"표준 입력 읽기 실패: {e}")
 
+_validated_models = set()
+
+
+def summarize_to_file(text: str, output_path: Path, original_filename: str, args: argparse.Namespace) -> bool:
+    """텍스트 하나를 요약하여 저장하고 Obsidian으로 전송 (입력이 비어 있으면 False)"""
+    # 모델 검증 (프로세스당 모델별 한 번)
+    if args.model not in _validated_models:
+        logging.info(f"모델 검증: {args.model}")
+        if not validate_model(args.model):
+            logging.warning(f"모델 '{args.model}'을 확인할 수 없습니다. 계속 진행합니다.")
+        _validated_models.add(args.model)
+    
+    # 입력 텍스트 검증
+    if not text.strip():
+        logging.error(f"입력 텍스트가 비어 있습니다: {original_filename}")
+        return False
+    
+    text_bytes = len(text.encode('utf-8'))
+    logging.info(f"입력 텍스트 크기: {len(text):,} 문자 ({text_bytes:,} bytes)")
+    logging.info(f"청크 크기: {args.chunk_size:,} bytes")
+    logging.info(f"모델: {args.model}")
+    
+    # 요약 실행
+    summary = summarize_text_mapreduce(
+        text=text,
+        model=args.model,
+        chunk_size=args.chunk_size,
+        max_tokens=args.max_tokens,
+        temperature=args.temperature,
+        target_chunks=args.target_chunks
+    )
+    
+    # 결과 저장
+    save_output(summary, output_path, args.json)
+
+    # Obsidian MCP 자동 전송
+    try:
+        from datetime import datetime
+
+        # UUID 추출 (파일명에서 확장자 제거)
+        # output_path는 예: /path/to/db/whisper_output/filename.summary.md
+        # UUID는 filename 부분
+        file_uuid = output_path.stem.replace('.summary', '')
+
+        # 파일 생성 시각 (현재 시각)
+        created_at = datetime.now()
+
+        logging.info(f"Obsidian MCP 전송 시작: UUID={file_uuid}")
+
+        # Obsidian에 전송 (동기 버전)
+        mcp_result = send_summary_to_obsidian_sync(
+            uuid=file_uuid,
+            summary_text=summary,
+            original_filename=original_filename,
+            created_at=created_at
+        )
+
+        if mcp_result["success"]:
+            logging.info(f"Obsidian MCP 전송 성공: {mcp_result['message']}")
+        else:
+            logging.warning(f"Obsidian MCP 전송 실패 (처리는 계속): {mcp_result['message']}")
+
+    except Exception as e:
+        # Obsidian 전송 실패해도 전체 프로세스는 계속 진행
+        logging.warning(f"Obsidian MCP 전송 중 오류 (처리는 계속): {e}")
+
+    # 완료 메시지
+    logging.info("요약 작업이 성공적으로 완료되었습니다")
+    if args.verbose:
+        logging.info(f"요약 길이: {len(summary):,} 문자")
+    return True
+
+
 def main() -> None:
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -562,6 +663,7 @@ def main() -> None:
         epilog="""
 사용 예시:
   %(prog)s meeting.txt                    # 기본 요약
+  %(prog)s a.md b.md c.md                 # 여러 파일을 한 번에 요약
   %(prog)s meeting.txt --verbose          # 상세 로그와 함께
   %(prog)s meeting.txt --json             # JSON 형식 출력
   %(prog)s meeting.txt --model llama3.1   # 다른 모델 사용
@@ -571,8 +673,8 @@ def main() -> None:
     
     parser.add_argument(
         "input_file", 
-        nargs='?',
-        help="입력 텍스트 파일 경로 (--stdin 사용 시 생략 가능)"
+        nargs='*',
+        help="입력 텍스트 파일 경로, 여러 개 지정 가능 (--stdin 사용 시 생략 가능)"
     )
     parser.add_argument(
         "--model", 
@@ -638,84 +740,37 @@ def main() -> None:
                 logging.warning("--stdin 사용 시 입력 파일 무시됨")
             text = read_from_stdin()
             output_path = Path(args.output) if args.output else Path("summary.md")
-        else:
-            if not args.input_file:
-                parser.error("입력 파일을 지정하거나 --stdin을 사용하세요")
-            
-            input_path = Path(args.input_file)
+            if not summarize_to_file(text, output_path, "stdin", args):
+                sys.exit(3)
+            return
+
+        if not args.input_file:
+            parser.error("입력 파일을 지정하거나 --stdin을 사용하세요")
+        if args.output and len(args.input_file) > 1:
+            parser.error("여러 입력 파일에는 --output을 사용할 수 없습니다")
+
+        # 여러 파일을 한 프로세스에서 처리하여 인터프리터 시작/임포트/모델 확인 비용을 한 번만 지불
+        # 한 파일이 실패해도 나머지는 계속 처리하고, 끝에 첫 실패의 종료 코드로 종료
+        exit_code = 0
+        for input_file in args.input_file:
+            input_path = Path(input_file)
             if not input_path.exists():
                 logging.error(f"입력 파일이 존재하지 않습니다: {input_path}")
-                sys.exit(2)
-            
-            text = read_text_with_fallback(input_path, args.encoding)
-            output_path = Path(args.output) if args.output else input_path.with_name(f"{input_path.stem}.summary.md")
-        
-        # 모델 검증
-        logging.info(f"모델 검증: {args.model}")
-        if not validate_model(args.model):
-            logging.warning(f"모델 '{args.model}'을 확인할 수 없습니다. 계속 진행합니다.")
-        
-        # 입력 텍스트 검증
-        if not text.strip():
-            logging.error("입력 텍스트가 비어 있습니다")
-            sys.exit(3)
-        
-        text_bytes = len(text.encode('utf-8'))
-        logging.info(f"입력 텍스트 크기: {len(text):,} 문자 ({text_bytes:,} bytes)")
-        logging.info(f"청크 크기: {args.chunk_size:,} bytes")
-        logging.info(f"모델: {args.model}")
-        
-        # 요약 실행
-        summary = summarize_text_mapreduce(
-            text=text,
-            model=args.model,
-            chunk_size=args.chunk_size,
-            max_tokens=args.max_tokens,
-            temperature=args.temperature,
-            target_chunks=args.target_chunks
-        )
-        
-        # 결과 저장
-        save_output(summary, output_path, args.json)
-
-        # Obsidian MCP 자동 전송
-        try:
-            from datetime import datetime
-
-            # UUID 추출 (파일명에서 확장자 제거)
-            # output_path는 예: /path/to/db/whisper_output/filename.summary.md
-            # UUID는 filename 부분
-            file_uuid = output_path.stem.replace('.summary', '')
-
-            # 원본 파일명 추출
-            original_filename = input_path.name if not args.stdin else "stdin"
-
-            # 파일 생성 시각 (현재 시각)
-            created_at = datetime.now()
-
-            logging.info(f"Obsidian MCP 전송 시작: UUID={file_uuid}")
-
-            # Obsidian에 전송 (동기 버전)
-            mcp_result = send_summary_to_obsidian_sync(
-                uuid=file_uuid,
-                summary_text=summary,
-                original_filename=original_filename,
-                created_at=created_at
-            )
-
-            if mcp_result["success"]:
-                logging.info(f"Obsidian MCP 전송 성공: {mcp_result['message']}")
-            else:
-                logging.warning(f"Obsidian MCP 전송 실패 (처리는 계속): {mcp_result['message']}")
-
-        except Exception as e:
-            # Obsidian 전송 실패해도 전체 프로세스는 계속 진행
-            logging.warning(f"Obsidian MCP 전송 중 오류 (처리는 계속): {e}")
+                exit_code = exit_code or 2
+                continue
 
-        # 완료 메시지
-        logging.info("요약 작업이 성공적으로 완료되었습니다")
-        if args.verbose:
-            logging.info(f"요약 길이: {len(summary):,} 문자")
+            try:
+                text = read_text_with_fallback(input_path, args.encoding)
+                output_path = Path(args.output) if args.output else input_path.with_name(f"{input_path.stem}.summary.md")
+                if not summarize_to_file(text, output_path, input_path.name, args):
+                    exit_code = exit_code or 3
+            except SummarizationError as e:
+                logging.error(f"요약 오류 ({input_path.name}): {e}")
+                exit_code = exit_code or 1
+
+        if exit_code:
+            logging.error("일부 파일의 요약에 실패했습니다")
+            sys.exit(exit_code)
         
     except KeyboardInterrupt:
         logging.info("사용자에 의해 중단되었습니다")
@@ -33,6 +33,8 @@ setup_logging()
 
 DB_BASE_PATH = get_db_base_path()
 DEFAULT_OUTPUT_DIR = DB_BASE_PATH / "whisper_output"
+# stdout으로 새로 생성된 파일을 알릴 때 쓰는 접두어 (run_workflow.py가 파싱)
+NEW_FILE_MARKER = "NEW_FILE: "
 
 # Whisper가 지원하는 파일 확장자 목록
 SUPPORTED_EXTS = {'.flac', '.m4a', '.mp3', '.mp4', '.mpeg', '.mpga', '.oga', '.ogg', '.qta', '.wav', '.webm'}
@@ -587,6 +589,9 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
         min_seg_length (int): 세그먼트 최소 길이
         normalize_punct (bool): 연속 마침표 정규화 여부
         requested_device (str): "auto", "cuda", "cpu", "mps" 중 하나로 지정된 장치
+
+    Returns:
+        list[Path]: 새로 생성된 마크다운 파일 경로 목록
     """
 
     # Load vocabulary keywords for improved STT accuracy
@@ -625,7 +630,7 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
     if not files_to_process:
         logging.info("입력 디렉토리 '%s'에 처리할 파일이 없습니다.", input_path_obj.resolve())
         logging.info("스크립트를 종료합니다.")
-        return
+        return []
 
     logging.info("처리 대상 파일 수: %d개", len(files_to_process))
     if recursive:
@@ -656,10 +661,11 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
         logging.error("스크립트를 종료합니다. 모델 이름이나 경로가 올바른지 확인하세요.")
         if progress_callback:
             progress_callback(f"모델 로드 실패: {e}")
-        return
+        return []
 
     # 변환 실행
     failures = []
+    created_files = []
     
     if workers <= 1:
         # 순차 처리
@@ -674,6 +680,7 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
                     filter_fillers, min_seg_length, normalize_punct, use_fp16, progress_callback
                 )
                 logging.info("변환 완료: %s → %s", file_path.name, output_path.name)
+                created_files.append(output_path)
             except Exception as e:
                 failures.append((file_path, str(e)))
                 logging.error("변환 실패: %s", file_path.name, exc_info=True)
@@ -698,6 +705,7 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
                 try:
                     output_path = future.result()
                     logging.info("변환 완료: %s → %s", file_path.name, output_path.name)
+                    created_files.append(output_path)
                 except Exception as e:
                     failures.append((file_path, str(e)))
                     logging.error("변환 실패: %s", file_path.name, exc_info=True)
@@ -716,6 +724,7 @@ def transcribe_audio_files(input_dir: str, output_dir: str, model_identifier: st
             logging.error("- %s: %s", file_path.name, error_msg)
     
     logging.info("모든 파일 변환 처리가 완료되었습니다.")
+    return created_files
 
 def main():
     """명령행 인자를 파싱하고 메인 함수를 실행합니다."""
@@ -865,7 +874,7 @@ def main():
     )
 
     # 메인 변환 함수 실행
-    transcribe_audio_files(
+    created_files = transcribe_audio_files(
         input_dir=str(input_path),
         output_dir=args.output_dir,
         model_identifier=model_to_use,
@@ -879,5 +888,9 @@ def main():
         requested_device=args.device
     )
 
+    # 호출한 워크플로우가 디렉토리를 다시 훑지 않도록 생성된 파일을 알린다
+    for output_path in created_files:
+        print(f"{NEW_FILE_MARKER}{output_path}", flush=True)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
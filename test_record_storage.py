@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Tests for upload streaming, the embedding index journal and record deletion."""
+
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ENGINE_DIR = Path(__file__).parent / "sttEngine"
+
+# Add sttEngine to path
+sys.path.insert(0, str(ENGINE_DIR))
+
+# STT/LLM packages the server imports at module level but these tests never
+# use. Stand-ins (with the attributes read at import time) are only installed
+# when the real package is missing.
+HEAVY_MODULES = {
+    "whisper": {},
+    "torch": {},
+    "ollama": {"generate": None},
+    "pypdf": {},
+    "mcp": {"ClientSession": object, "StdioServerParameters": object},
+    "mcp.client": {},
+    "mcp.client.stdio": {"stdio_client": None},
+}
+
+
+def _engine_modules() -> list[str]:
+    return [
+        name for name, module in list(sys.modules.items())
+        if str(getattr(module, "__file__", None) or "").startswith(str(ENGINE_DIR))
+    ]
+
+
+@pytest.fixture
+def db_path(monkeypatch, tmp_path):
+    """Point DB_FOLDER_PATH at a temp dir and import sttEngine modules fresh against it."""
+    db_path = tmp_path / "DB"
+    monkeypatch.setenv("DB_FOLDER_PATH", str(db_path))
+    # Module-level paths are computed at import, so drop already imported
+    # copies; monkeypatch puts them back after the test.
+    for name in _engine_modules():
+        monkeypatch.delitem(sys.modules, name)
+    yield db_path
+    for name in _engine_modules():
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def embedding_pipeline(db_path):
+    """The embedding pipeline module with its index under the temp DB folder."""
+    return importlib.import_module("embedding_pipeline")
+
+
+@pytest.fixture
+def server(db_path, monkeypatch):
+    """Import the server, with stand-ins for heavy packages that are not installed."""
+    for name, attrs in HEAVY_MODULES.items():
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            stub = types.ModuleType(name)
+            for attr, value in attrs.items():
+                setattr(stub, attr, value)
+            monkeypatch.setitem(sys.modules, name, stub)
+
+    # Importing the server tees stdout/stderr into its log file.
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    module = importlib.import_module("sttEngine.server")
+    logfile = getattr(sys.stdout, "logfile", None)
+    yield module
+    if logfile is not None:
+        logfile.close()
+
+
+ENTRY_A = {"sha256": "a" * 64, "mtime_ns": 1, "size": 10, "base": "whisper_output"}
+ENTRY_B = {"sha256": "b" * 64, "mtime_ns": 2, "size": 20, "base": "whisper_output"}
+ENTRY_C = {"sha256": "c" * 64, "mtime_ns": 3, "size": 30, "base": "whisper_output"}
+
+
+def test_load_index_replays_journal(embedding_pipeline):
+    """Journal appends (including removals) are applied on top of index.json."""
+    embedding_pipeline.save_index({"a.md": ENTRY_A})
+    index_bytes = embedding_pipeline.INDEX_FILE.read_bytes()
+
+    embedding_pipeline.save_index_entry("b.md", ENTRY_A)
+    embedding_pipeline.save_index_entry("a.md", None)
+    embedding_pipeline.save_index_entry("b.md", ENTRY_B)
+
+    expected = {"b.md": ENTRY_B}
+    assert embedding_pipeline.load_index() == expected
+    # The second load goes through the snapshot and must agree.
+    assert embedding_pipeline.load_index() == expected
+    # Loading never rewrites index.json.
+    assert embedding_pipeline.INDEX_FILE.read_bytes() == index_bytes
+
+    # A full save keeps entries journaled by another writer after the load.
+    index = embedding_pipeline.load_index()
+    embedding_pipeline.save_index_entry("c.md", ENTRY_C)
+    index["a.md"] = ENTRY_A
+    embedding_pipeline.save_index(index)
+
+    assert not embedding_pipeline.INDEX_LOG_FILE.exists()
+    assert embedding_pipeline.load_index() == {"a.md": ENTRY_A, "b.md": ENTRY_B, "c.md": ENTRY_C}
+
+
+def test_load_index_migrates_legacy_file(embedding_pipeline):
+    """A pre-schema index.json is normalized in memory and upgraded by compact_index."""
+    legacy = {
+        "whisper_output/rec/a.md": ENTRY_A,
+        f"{embedding_pipeline.DB_ALIAS}/whisper_output/rec/b.md": ENTRY_B,
+    }
+    embedding_pipeline.VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+    embedding_pipeline.INDEX_FILE.write_text(json.dumps(legacy), encoding="utf-8")
+
+    expected = {
+        os.path.join("rec", "a.md"): ENTRY_A,
+        os.path.join("rec", "b.md"): ENTRY_B,
+    }
+    assert embedding_pipeline.load_index() == expected
+    assert json.loads(embedding_pipeline.INDEX_FILE.read_text(encoding="utf-8")) == legacy
+
+    embedding_pipeline.compact_index()
+
+    data = json.loads(embedding_pipeline.INDEX_FILE.read_text(encoding="utf-8"))
+    assert data == {"_schema": embedding_pipeline.INDEX_SCHEMA_VERSION, "entries": expected}
+    assert embedding_pipeline.load_index() == expected
+
+
+def _multipart_body(boundary: str, parts: list[tuple[str, str | None, bytes]]) -> bytes:
+    body = b"preamble\r\n"
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += f"--{boundary}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+        body += content + b"\r\n"
+    return body + f"--{boundary}--\r\n".encode()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 61, 1 << 20])
+def test_stream_multipart_files_splits_across_chunks(server, monkeypatch, chunk_size):
+    """Boundaries split across reads of UPLOAD_CHUNK_SIZE still end each part."""
+    monkeypatch.setattr(server, "UPLOAD_CHUNK_SIZE", chunk_size)
+
+    boundary = "----RecordRouteBoundary"
+    # The contents contain near-miss delimiters that must stay in the file.
+    first = b"line one\r\n--" + boundary[:-1].encode() + b"x\r\nline two"
+    second = b"\r\n--" + b"\x00\xff" * 50
+    body = _multipart_body(boundary, [
+        ("files", "a.m4a", first),
+        ("note", None, b"ignored field"),
+        ("files", "b.m4a", second),
+    ])
+
+    files = server.stream_multipart_files(io.BytesIO(body), boundary, len(body))
+
+    entries = files["files"]
+    assert [entry["filename"] for entry in entries] == ["a.m4a", "b.m4a"]
+    for entry, content in zip(entries, (first, second)):
+        assert entry["temp_path"].parent == server.UPLOAD_DIR
+        assert entry["temp_path"].read_bytes() == content
+        assert entry["file_hash"] == hashlib.sha256(content).hexdigest()
+    assert "note" not in files
+
+
+def test_delete_records_with_duplicate_ids(server):
+    """A record listed twice is deleted once and reported once as a success."""
+    folder = "duplicate-delete-test"
+    upload_dir = server.UPLOAD_DIR / folder
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    audio_path = upload_dir / "audio.m4a"
+    audio_path.write_bytes(b"audio")
+
+    record = server.add_upload_record(audio_path, "audio")
+    success, results = server.delete_records([record["id"], record["id"]])
+
+    assert success
+    assert results == {record["id"]: {"success": True}}
+    assert not upload_dir.exists()
+    assert (server.DELETED_UPLOAD_DIR / folder / "audio.m4a").read_bytes() == b"audio"
+    stored = server.load_upload_history().by_id[record["id"]]
+    assert stored["deleted"] is True